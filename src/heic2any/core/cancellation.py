@@ -11,6 +11,10 @@ from __future__ import annotations
 import threading
 
 
+class OperationCancelled(Exception):
+    """任务执行过程中感知到取消请求时抛出。"""
+
+
 class CancellationToken:
     """简单取消令牌。"""
 
@@ -24,3 +28,8 @@ class CancellationToken:
     def cancelled(self) -> bool:
         return self._evt.is_set()
 
+    def raise_if_cancelled(self) -> None:
+        """若已取消则抛出 OperationCancelled，供长耗时步骤之间协作式检查。"""
+        if self._evt.is_set():
+            raise OperationCancelled()
+
@@ -5,6 +5,7 @@
 注意：
 - 若缺少 pillow-heif，将抛出异常提示用户安装依赖。
 - 支持质量(质量对JPG/JPEG生效；PNG映射到压缩级别)、DPI、尺寸调整。
+- 可传入取消令牌：在解码/缩放/编码等阶段之间检查，取消时抛出 OperationCancelled。
 """
 
 from __future__ import annotations
@@ -12,9 +13,17 @@ from __future__ import annotations
 import os
 from typing import Tuple, Optional
 
+from heic2any.core.cancellation import CancellationToken
+
+
+_IMAGE_MODULE = None
+
 
 def _import_image_libs():
-    """导入图像库，缺少依赖时报错。"""
+    """导入图像库，缺少依赖时报错；HEIF 插件注册成功后进程内复用，不再逐张重复注册。"""
+    global _IMAGE_MODULE
+    if _IMAGE_MODULE is not None:
+        return _IMAGE_MODULE
     try:
         from PIL import Image  # type: ignore
     except Exception as e:  # pragma: no cover
@@ -26,6 +35,7 @@ def _import_image_libs():
     except Exception as e:
         # 允许用户之后再安装；此时HEIC无法打开
         raise RuntimeError("未安装 pillow-heif，请先安装: pip install pillow-heif") from e
+    _IMAGE_MODULE = Image
     return Image
 
 
@@ -59,13 +69,19 @@ def convert_one(
     webp_lossless: bool | None = None,
     webp_method: Optional[int] = None,
     tiff_compression: Optional[str] = None,
+    token: Optional[CancellationToken] = None,
 ) -> Tuple[int, int]:
     """执行单张图片转换。
 
     返回：输出尺寸(width, height)
-    抛出：RuntimeError（依赖缺失或读取失败）
+    抛出：RuntimeError（依赖缺失或读取失败）；OperationCancelled（令牌已取消）
     """
+    def _check() -> None:
+        if token is not None:
+            token.raise_if_cancelled()
+
     Image = _import_image_libs()
+    _check()
     with Image.open(src_path) as im:
         # 原始尺寸
         ow, oh = im.size
@@ -90,10 +106,18 @@ def convert_one(
                     tw = ow
                 if th == 0:
                     th = oh
-            if (tw, th) != im.size:
-                im = im.resize((tw, th))
         else:
             tw, th = ow, oh
+        # 缩小JPEG源时先在DCT域按 1/2~1/8 解码（不小于目标尺寸），避免整图解码后再缩
+        if im.format == 'JPEG' and tw < ow and th < oh:
+            im.draft('RGB', (tw, th))
+        # Image.open 为惰性解码；显式解码成独立阶段，否则解码会并入后续 resize/save，
+        # 其间无法感知取消。HEVC 解码与编码均为单次原生调用，取消延迟以单个阶段为上限
+        im.load()
+        _check()
+        if (tw, th) != im.size:
+            im = im.resize((tw, th))
+            _check()
 
         # RGB 确保
         if im.mode in ("RGBA", "LA"):
@@ -133,6 +157,8 @@ def convert_one(
                 m = max(0, min(6, int(webp_method)))
                 save_kwargs.update({"method": m})
 
+        # 编码前最后一次检查，取消时不会留下半写的输出文件
+        _check()
         # 让Pillow按扩展名自动识别格式，可避免'JPG'等大小写映射问题
         im.save(dst_path, **save_kwargs)
         return (tw, th)
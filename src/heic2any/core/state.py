@@ -8,6 +8,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass, field, asdict
 from enum import Enum, auto
+from functools import cached_property
 from typing import Optional, Tuple
 
 from heic2any.core.cancellation import CancellationToken
@@ -23,6 +24,17 @@ class JobStatus(Enum):
     CANCELLED = auto()
 
 
+# 状态显示文本
+STATUS_TEXT = {
+    JobStatus.WAITING: "等待",
+    JobStatus.RUNNING: "进行中",
+    JobStatus.PAUSED: "已暂停",
+    JobStatus.COMPLETED: "已完成",
+    JobStatus.FAILED: "失败",
+    JobStatus.CANCELLED: "已取消",
+}
+
+
 class JobState(Enum):
     """更清晰的外部状态命名（别名）。
 
@@ -84,6 +96,23 @@ class JobItem:
     # 取消令牌（每个任务持有）
     token: CancellationToken = field(default_factory=CancellationToken)
 
+    @cached_property
+    def stem(self) -> str:
+        """源文件名（不含目录与扩展名）；src_path 创建后不变，首次访问后缓存。
+
+        以字符串 rfind 直接切片，结果与 os.path.splitext(os.path.basename(...))[0] 一致
+        （含 Windows 的 '/' 备用分隔符；开头的点不视为扩展名分隔）。
+        """
+        p = self.src_path
+        cut = p.rfind(os.sep)
+        if os.altsep:
+            cut = max(cut, p.rfind(os.altsep))
+        base = p[cut + 1:]
+        dot = base.rfind('.')
+        if dot > 0 and base[:dot].strip('.'):
+            return base[:dot]
+        return base
+
     @staticmethod
     def from_source(path: str) -> "JobItem":
         # 初始导出目录设为当前工作目录下的 output
@@ -101,15 +130,7 @@ class JobItem:
         return "-"
 
     def status_text(self) -> str:
-        m = {
-            JobStatus.WAITING: "等待",
-            JobStatus.RUNNING: "进行中",
-            JobStatus.PAUSED: "已暂停",
-            JobStatus.COMPLETED: "已完成",
-            JobStatus.FAILED: "失败",
-            JobStatus.CANCELLED: "已取消",
-        }
-        return m.get(self.status, "-")
+        return STATUS_TEXT.get(self.status, "-")
 
 
 @dataclass
@@ -164,6 +185,11 @@ class AppSettings:
             pass
         return AppSettings()
 
+    def snapshot(self) -> str:
+        """与写盘内容一致的序列化快照，用于判断设置是否有变化（tuple/list 视为相同）。"""
+        import json
+        return json.dumps(asdict(self), ensure_ascii=False, sort_keys=True)
+
     @staticmethod
     def save(s: "AppSettings") -> None:
         """保存到用户目录JSON。"""
@@ -7,11 +7,12 @@ from __future__ import annotations
 
 import os
 import threading
-from concurrent.futures import ThreadPoolExecutor, Future
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 from typing import Callable, Dict, List, Optional, Tuple
 import queue
 
 from heic2any.core.state import JobItem, JobStatus
+from heic2any.core.cancellation import CancellationToken, OperationCancelled
 from heic2any.core import converter
 from heic2any.utils.naming import build_output_path
 from heic2any.core.event_bus import EventBus, EventType
@@ -71,6 +72,9 @@ class TaskManager:
                 break
             if job.status in (JobStatus.COMPLETED, JobStatus.RUNNING, JobStatus.CANCELLED):
                 continue
+            # 上一轮停止时令牌已被取消；重新入队的任务需换新令牌
+            if job.token.cancelled:
+                job.token = CancellationToken()
             # 标记为排队
             if job.status != JobStatus.PAUSED:
                 job.status = JobStatus.WAITING
@@ -123,7 +127,13 @@ class TaskManager:
             except Exception:
                 break
 
-    def stop(self) -> None:
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """停止：取消所有任务令牌并释放线程池。
+
+        参数:
+            timeout: 为 None 时不等待工作线程；否则最多等待该秒数，
+                     超时仍有线程未退出则抛出 TimeoutError。
+        """
         self._stop.set(); self._paused.clear()
         # 取消未开始任务
         jobs = self._jobs_ref or []
@@ -141,6 +151,7 @@ class TaskManager:
                 except Exception:
                     break
         with self._lock:
+            futures = list(self._futures)
             if self._executor is not None:
                 try:
                     self._executor.shutdown(wait=False, cancel_futures=True)
@@ -150,6 +161,11 @@ class TaskManager:
             self._futures = []
             self._queue = None
             self._paused_buffer.clear()
+        # 有界等待：工作线程在当前图片的阶段边界感知取消后退出
+        if timeout is not None and futures:
+            _, not_done = wait(futures, timeout=timeout)
+            if not_done:
+                raise TimeoutError(f"{len(not_done)} 个工作线程未在 {timeout:.1f} 秒内退出")
 
     # ---------- 内部执行 ----------
     def _worker_loop(self, worker_id: int) -> None:
@@ -205,11 +221,22 @@ class TaskManager:
                     webp_lossless=job.webp_lossless if job.export_format.lower() == 'webp' else None,
                     webp_method=job.webp_method if job.export_format.lower() == 'webp' else None,
                     tiff_compression=job.tiff_compression if job.export_format.lower() in ('tif','tiff') else None,
+                    token=job.token,
                 )
                 job.orig_size = (w, h)
                 job.progress = 100
                 job.status = JobStatus.COMPLETED
                 self._emit_job(idx, job)
+            except OperationCancelled:
+                # 协作式取消：在阶段边界退出，不视为失败。
+                # 由 stop() 打断的任务回到等待态，下次 start() 重新入队；其余为单个任务的取消
+                if self._stop.is_set():
+                    job.status = JobStatus.WAITING
+                    job.progress = 0
+                else:
+                    job.status = JobStatus.CANCELLED
+                    job.progress = 100
+                self._emit_job(idx, job)
             except Exception as e:
                 job.status = JobStatus.FAILED
                 job.error = str(e)
@@ -11,26 +11,213 @@ from __future__ import annotations
 
 import os
 import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
-
-from PySide6.QtCore import Qt, QSize, Signal, QObject, QEvent
-from PySide6.QtGui import QAction, QIcon, QPixmap, QImage, QCursor, QColor
+from datetime import datetime
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from PySide6.QtCore import (
+    Qt, QSize, QPoint, Signal, QObject, QEvent, QTimer, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+from PySide6.QtGui import QAction, QIcon, QPixmap, QPixmapCache, QImage, QCursor, QColor, QBrush
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QSplitter, QTreeWidget, QTreeWidgetItem, QFileDialog, QMenu, QToolButton,
+    QSplitter, QTreeView, QAbstractItemView, QFileDialog, QMenu, QToolButton,
     QStatusBar, QProgressBar, QComboBox, QGroupBox, QFormLayout, QSlider,
     QSpinBox, QCheckBox, QLineEdit, QStyle, QMessageBox, QDialog, QListWidget,
-    QListWidgetItem, QDialogButtonBox, QSystemTrayIcon, QRadioButton, QStackedWidget, QSizePolicy, QGridLayout
+    QListWidgetItem, QDialogButtonBox, QSystemTrayIcon, QRadioButton, QStackedWidget, QSizePolicy, QGridLayout,
+    QApplication, QStyledItemDelegate
 )
 from PySide6.QtWidgets import QAbstractSpinBox
 
-from heic2any.core.state import JobItem, JobStatus, ExportFormat, AppSettings
+from heic2any.core.state import JobItem, JobStatus, ExportFormat, AppSettings, STATUS_TEXT
 from heic2any.core.tasks import TaskManager
 from heic2any.core.event_bus import EventBus, EventType
-from heic2any.utils.images import make_placeholder_thumbnail, load_thumbnail, get_image_size
+from heic2any.utils.images import make_placeholder_thumbnail, load_thumbnail_and_size, get_image_size, snap_thumb_side
 from heic2any.utils.naming import render_output_name, build_output_path
-from heic2any.utils.conda import CondaEnv, find_conda_envs, test_env_dependencies, find_system_pythons
+
+if TYPE_CHECKING:
+    from heic2any.utils.conda import CondaEnv
+
+
+# 目录存在性缓存：path -> (是否存在, 检查时刻)；网络盘/拔出的U盘上stat可能很慢
+_DIR_CACHE: dict[str, tuple[bool, float]] = {}
+_DIR_CACHE_MAX = 64
+
+
+def _isdir_cached(path: str, ttl: float = 2.0) -> bool:
+    """带短时TTL的 os.path.isdir，重复打开选择对话框时避免反复stat。"""
+    now = time.monotonic()
+    hit = _DIR_CACHE.get(path)
+    if hit is not None and now - hit[1] < ttl:
+        return hit[0]
+    ok = os.path.isdir(path)
+    if len(_DIR_CACHE) >= _DIR_CACHE_MAX:
+        _DIR_CACHE.clear()
+    _DIR_CACHE[path] = (ok, now)
+    return ok
+
+
+def _invalidate_dir_cache(path: str | None = None) -> None:
+    """清除目录缓存；path 为 None 时全部清除。"""
+    if path is None:
+        _DIR_CACHE.clear()
+    else:
+        _DIR_CACHE.pop(path, None)
+
+
+_HEIF_EXT = frozenset({'.heic', '.heif'})
+
+# 体积预估常量：PNG 压缩系数（经验值，照片类内容）：0=1.00（无压缩）…9≈0.40
+_PNG_RATIO = (1.00, 0.92, 0.85, 0.80, 0.75, 0.70, 0.60, 0.52, 0.46, 0.40)
+# JPEG 体积系数 = A + B*(质量/100)，即 0.6 .. 1.8
+_JPEG_RATIO_A = 0.6
+_JPEG_RATIO_B = 1.2
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+def _format_bytes(n: int) -> str:
+    """将字节数格式化为可读字符串（n 为整数）。"""
+    if n < 1024:
+        return f"{n}B"
+    # 单位档位由二进制位数直接得出（每档 10 位），无需逐级除法
+    i = min(4, (n.bit_length() - 1) // 10)
+    return f"{n / (1 << (i * 10)):.1f}{_UNITS[i]}"
+
+
+@lru_cache(maxsize=4096)
+def _estimate_text(fmt: str, w: int, h: int, lvl: int, png_optimize: bool,
+                   size: int, quality: int, tiff_compression: str) -> str:
+    """按导出参数估算输出体积文本；纯函数，相同参数的重复刷新直接命中缓存。"""
+    # PNG：基于像素尺寸进行估算，解决严重低估问题
+    if fmt == 'png' and w > 0 and h > 0:
+        lvl = max(0, min(9, lvl))
+        # 原始大小：RGB 每像素3字节，外加少量固定开销
+        raw = w * h * 3
+        overhead = 64 * 1024  # PNG 头/块等开销近似
+        ratio = _PNG_RATIO[lvl]
+        if png_optimize:
+            ratio *= 0.95
+        return _format_bytes(int(raw * ratio + overhead))
+
+    # 其他格式：退化到启发式（仍考虑尺寸缺失时的容错）
+    if size <= 0:
+        # 若没有源大小，则无法估算
+        return "-"
+    if fmt in ('jpg', 'jpeg'):
+        q = max(1, min(100, quality))
+        ratio = _JPEG_RATIO_A + _JPEG_RATIO_B * (q / 100.0)
+    elif fmt == 'webp':
+        q = max(1, min(100, quality))
+        ratio = 0.5 + 1.0 * (q / 100.0)  # 0.5 .. 1.5
+    elif fmt in ('tif', 'tiff'):
+        ratio = 1.4 if tiff_compression != 'tiff_lzw' else 1.3
+    else:
+        ratio = 1.0
+    return _format_bytes(int(size * ratio))
+
+
+@lru_cache(maxsize=512)
+def _work_factor(fmt: str, quality: int, lvl: int) -> float:
+    """耗时预估的格式工作量系数（相对源文件MB）；参数组合很少，结果缓存复用。"""
+    if fmt in ('jpg', 'jpeg'):
+        factor = 0.8 + 1.0*(max(1, min(100, quality))/100.0)
+    elif fmt == 'png':
+        factor = 1.6 - 0.08*lvl
+    elif fmt == 'webp':
+        factor = 0.7 + 1.1*(max(1, min(100, quality))/100.0)
+    elif fmt in ('tif', 'tiff'):
+        factor = 1.3
+    else:
+        factor = 1.0
+    return max(0.3, factor)
+
+
+def _scan_heic_paths(roots: List[str], batch_cb, cancel: threading.Event, batch_size: int = 256) -> None:
+    """递归扫描（os.scandir，免额外stat）收集HEIC路径，每 batch_size 个回调一次。
+
+    roots 可同时包含文件与目录；最后一次回调 done=True（可能为空批次）。
+    """
+    batch: List[str] = []
+    stack: List[str] = []
+    for p in roots:
+        if os.path.isdir(p):
+            stack.append(p)
+        elif os.path.splitext(p)[1].lower() in _HEIF_EXT:
+            batch.append(p)
+    push = stack.append
+    pop = stack.pop
+    try:
+        while stack and not cancel.is_set():
+            try:
+                it = os.scandir(pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            push(entry.path)
+                            continue
+                        # 只对扩展名做小写，避免每个文件名整串分配
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot >= 0 and name[dot:].lower() in _HEIF_EXT and entry.is_file():
+                            batch.append(entry.path)
+                    except OSError:
+                        continue
+                    if len(batch) >= batch_size:
+                        batch_cb(batch, False)
+                        batch = []
+    finally:
+        batch_cb(batch, True)
+
+
+def _read_job_metadata(items: List[Tuple[int, JobItem]], emit, cancel: threading.Event, chunk: int = 64) -> None:
+    """后台读取文件大小、修改时间与像素尺寸（仅读文件头），每 chunk 行回调一次。
+
+    回调参数为 [(idx, job, bytes, mtime_ns, (w, h)|None)]。
+    """
+    out: list = []
+    for idx, job in items:
+        if cancel.is_set():
+            return
+        try:
+            st = os.stat(job.src_path)
+            size_b, mtime = st.st_size, st.st_mtime_ns
+        except OSError:
+            size_b, mtime = 0, 0
+        # 可视行的缩略图解码已顺带读到尺寸时，不再重复打开文件解析头部
+        dims = None if any(job.orig_size) else get_image_size(job.src_path)
+        out.append((idx, job, size_b, mtime, dims))
+        if len(out) >= chunk:
+            emit(out)
+            out = []
+    if out:
+        emit(out)
+
+
+def _prefetch_files(paths: List[str], cancel: threading.Event) -> None:
+    """预读即将解码的源文件到系统页缓存，让磁盘读取与当前解码重叠。
+
+    Linux 等平台用 posix_fadvise(WILLNEED) 交由内核异步预读整个文件；其余平台读入文件头部。
+    """
+    advise = getattr(os, 'posix_fadvise', None)
+    for p in paths:
+        if cancel.is_set():
+            return
+        try:
+            with open(p, 'rb') as f:
+                if advise is not None:
+                    advise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    f.read(65536)
+        except OSError:
+            pass
 
 
 class EnvSelectDialog(QDialog):
@@ -47,7 +234,8 @@ class EnvSelectDialog(QDialog):
         lay.addWidget(self.btns)
         self.btns.accepted.connect(self.accept)
         self.btns.rejected.connect(self.reject)
-        # 加载环境
+        # 加载环境（环境发现模块仅在打开对话框时导入，缩短启动时间）
+        from heic2any.utils.conda import find_conda_envs
         envs = find_conda_envs()
         for e in envs:
             it = QListWidgetItem(f"{e.name} — {e.prefix}")
@@ -61,6 +249,11 @@ class EnvSelectDialog(QDialog):
         return it.data(Qt.UserRole)
 
 
+class _ScanSignals(QObject):
+    """后台扫描结果信号：(来源标识, 解释器路径列表)。"""
+    found = Signal(str, object)
+
+
 class AppSettingsDialog(QDialog):
     """应用设置对话框：通知开关与关闭行为选项。"""
 
@@ -100,21 +293,31 @@ class AppSettingsDialog(QDialog):
         from sys import executable as _cur_py
         self.cmb_python.addItem(getattr(settings, 'selected_python_path', '') or _cur_py)
         self.btn_scan_py = QPushButton("扫描…")
-        def _scan():
-            self.btn_scan_py.setEnabled(False); self.btn_scan_py.setText("扫描中…")
-            pythons = []
+        # 系统解释器与Conda环境两路扫描并行在后台线程执行，结果经信号回到UI线程合并
+        self._scan_signals = _ScanSignals(self)
+        self._scan_results: dict[str, list] = {}
+
+        def _run_scan(kind: str) -> None:
+            found: list = []
             try:
-                pythons.extend(find_system_pythons())
+                from heic2any.utils.conda import find_conda_envs, find_system_pythons
+                if kind == 'system':
+                    found = list(find_system_pythons())
+                else:
+                    found = [e.python for e in find_conda_envs() if os.path.isfile(e.python)]
             except Exception:
                 pass
             try:
-                for e in find_conda_envs():
-                    if os.path.isfile(e.python):
-                        pythons.append(e.python)
-            except Exception:
-                pass
-            seen=set(); self.cmb_python.clear()
-            for p in pythons:
+                self._scan_signals.found.emit(kind, found)
+            except RuntimeError:
+                pass  # 对话框已关闭
+
+        def _on_found(kind: str, found: list) -> None:
+            self._scan_results[kind] = found
+            if len(self._scan_results) < 2:
+                return
+            seen = set(); self.cmb_python.clear()
+            for p in self._scan_results['system'] + self._scan_results['conda']:
                 if p and p not in seen:
                     self.cmb_python.addItem(p); seen.add(p)
             # 恢复选择
@@ -123,6 +326,14 @@ class AppSettingsDialog(QDialog):
             if idx >= 0:
                 self.cmb_python.setCurrentIndex(idx)
             self.btn_scan_py.setEnabled(True); self.btn_scan_py.setText("扫描…")
+
+        def _scan():
+            self.btn_scan_py.setEnabled(False); self.btn_scan_py.setText("扫描中…")
+            self._scan_results = {}
+            pool = QThreadPool.globalInstance()
+            pool.start(lambda: _run_scan('system'))
+            pool.start(lambda: _run_scan('conda'))
+        self._scan_signals.found.connect(_on_found)
         self.btn_scan_py.clicked.connect(_scan)
         row_py = QWidget(); rpy = QHBoxLayout(row_py); rpy.setContentsMargins(0,0,0,0); rpy.setSpacing(8)
         rpy.addWidget(self.cmb_python,1); rpy.addWidget(self.btn_scan_py)
@@ -211,12 +422,23 @@ class AppSettingsDialog(QDialog):
 class FormatSettingsDialog(QDialog):
     """格式相关的高级设置对话框。"""
 
+    # 格式 -> (构建方法名, 回写方法名)；未列出的格式仅显示通用DPI
+    _FORMAT_HANDLERS = {
+        'jpg': ('_build_jpeg', '_apply_jpeg'),
+        'jpeg': ('_build_jpeg', '_apply_jpeg'),
+        'png': ('_build_png', '_apply_png'),
+        'webp': ('_build_webp', '_apply_webp'),
+        'tif': ('_build_tiff', '_apply_tiff'),
+        'tiff': ('_build_tiff', '_apply_tiff'),
+    }
+
     def __init__(self, fmt: str, parent: QWidget | None, mw: 'MainWindow') -> None:
         super().__init__(parent)
         self.setWindowTitle("更多设置")
         self.resize(420, 320)
         self._fmt = (fmt or '').lower()
         self._mw = mw
+        self._handlers = self._FORMAT_HANDLERS.get(self._fmt)
         lay = QVBoxLayout(self)
 
         form = QFormLayout()
@@ -226,35 +448,8 @@ class FormatSettingsDialog(QDialog):
         form.addRow("DPI-X", self.sp_dpi_x)
         form.addRow("DPI-Y", self.sp_dpi_y)
 
-        if self._fmt in ('jpg','jpeg'):
-            self.chk_jpg_prog = QCheckBox("渐进式(Progressive)")
-            self.chk_jpg_prog.setChecked(mw._adv_jpeg_progressive)
-            self.chk_jpg_opt = QCheckBox("优化(Optimize)")
-            self.chk_jpg_opt.setChecked(mw._adv_jpeg_optimize)
-            form.addRow(self.chk_jpg_prog)
-            form.addRow(self.chk_jpg_opt)
-        elif self._fmt == 'png':
-            self.chk_png_opt = QCheckBox("优化(Optimize)")
-            self.chk_png_opt.setChecked(mw._adv_png_optimize)
-            form.addRow(self.chk_png_opt)
-        elif self._fmt == 'webp':
-            self.chk_webp_lossless = QCheckBox("无损(Lossless)")
-            self.chk_webp_lossless.setChecked(mw._adv_webp_lossless)
-            self.sl_webp_method = QSlider(Qt.Horizontal); self.sl_webp_method.setRange(0, 6); self.sl_webp_method.setValue(int(mw._adv_webp_method))
-            self.lbl_webp_method = QLabel(str(mw._adv_webp_method))
-            self.sl_webp_method.valueChanged.connect(lambda v: self.lbl_webp_method.setText(str(v)))
-            row = QWidget(); rlay = QHBoxLayout(row); rlay.setContentsMargins(0,0,0,0)
-            rlay.addWidget(self.sl_webp_method, 1); rlay.addWidget(self.lbl_webp_method)
-            form.addRow(self.chk_webp_lossless)
-            form.addRow("方法(method)", row)
-        elif self._fmt in ('tif','tiff'):
-            self.cmb_tiff_comp = QComboBox(); self.cmb_tiff_comp.addItems(["tiff_deflate","tiff_lzw","tiff_adobe_deflate"])
-            try:
-                idx = ["tiff_deflate","tiff_lzw","tiff_adobe_deflate"].index(mw._adv_tiff_compression)
-            except ValueError:
-                idx = 0
-            self.cmb_tiff_comp.setCurrentIndex(idx)
-            form.addRow("压缩方式", self.cmb_tiff_comp)
+        if self._handlers is not None:
+            getattr(self, self._handlers[0])(form, mw)
 
         lay.addLayout(form)
 
@@ -272,39 +467,338 @@ class FormatSettingsDialog(QDialog):
         lay.addStretch(1)
         lay.addWidget(btns)
 
+    # ---------- 按格式构建 ----------
+    def _build_jpeg(self, form: QFormLayout, mw: 'MainWindow') -> None:
+        self.chk_jpg_prog = QCheckBox("渐进式(Progressive)")
+        self.chk_jpg_prog.setChecked(mw._adv_jpeg_progressive)
+        self.chk_jpg_opt = QCheckBox("优化(Optimize)")
+        self.chk_jpg_opt.setChecked(mw._adv_jpeg_optimize)
+        form.addRow(self.chk_jpg_prog)
+        form.addRow(self.chk_jpg_opt)
+
+    def _build_png(self, form: QFormLayout, mw: 'MainWindow') -> None:
+        self.chk_png_opt = QCheckBox("优化(Optimize)")
+        self.chk_png_opt.setChecked(mw._adv_png_optimize)
+        form.addRow(self.chk_png_opt)
+
+    def _build_webp(self, form: QFormLayout, mw: 'MainWindow') -> None:
+        self.chk_webp_lossless = QCheckBox("无损(Lossless)")
+        self.chk_webp_lossless.setChecked(mw._adv_webp_lossless)
+        self.sl_webp_method = QSlider(Qt.Horizontal); self.sl_webp_method.setRange(0, 6); self.sl_webp_method.setValue(int(mw._adv_webp_method))
+        self.lbl_webp_method = QLabel(str(mw._adv_webp_method))
+        self.sl_webp_method.valueChanged.connect(lambda v: self.lbl_webp_method.setText(str(v)))
+        row = QWidget(); rlay = QHBoxLayout(row); rlay.setContentsMargins(0,0,0,0)
+        rlay.addWidget(self.sl_webp_method, 1); rlay.addWidget(self.lbl_webp_method)
+        form.addRow(self.chk_webp_lossless)
+        form.addRow("方法(method)", row)
+
+    def _build_tiff(self, form: QFormLayout, mw: 'MainWindow') -> None:
+        self.cmb_tiff_comp = QComboBox(); self.cmb_tiff_comp.addItems(["tiff_deflate","tiff_lzw","tiff_adobe_deflate"])
+        try:
+            idx = ["tiff_deflate","tiff_lzw","tiff_adobe_deflate"].index(mw._adv_tiff_compression)
+        except ValueError:
+            idx = 0
+        self.cmb_tiff_comp.setCurrentIndex(idx)
+        form.addRow("压缩方式", self.cmb_tiff_comp)
+
+    # ---------- 按格式回写 ----------
+    def _apply_jpeg(self, mw: 'MainWindow') -> None:
+        mw._adv_jpeg_progressive = bool(self.chk_jpg_prog.isChecked())
+        mw._adv_jpeg_optimize = bool(self.chk_jpg_opt.isChecked())
+        mw.settings.default_jpeg_progressive = mw._adv_jpeg_progressive
+        mw.settings.default_jpeg_optimize = mw._adv_jpeg_optimize
+
+    def _apply_png(self, mw: 'MainWindow') -> None:
+        mw._adv_png_optimize = bool(self.chk_png_opt.isChecked())
+        mw.settings.default_png_optimize = mw._adv_png_optimize
+
+    def _apply_webp(self, mw: 'MainWindow') -> None:
+        mw._adv_webp_lossless = bool(self.chk_webp_lossless.isChecked())
+        mw._adv_webp_method = int(self.sl_webp_method.value())
+        mw.settings.default_webp_lossless = mw._adv_webp_lossless
+        mw.settings.default_webp_method = mw._adv_webp_method
+
+    def _apply_tiff(self, mw: 'MainWindow') -> None:
+        mw._adv_tiff_compression = self.cmb_tiff_comp.currentText()
+        mw.settings.default_tiff_compression = mw._adv_tiff_compression
+
     def apply_to_main(self) -> None:
-        """将对话框选择应用回主窗口缓存与设置。"""
+        """将对话框选择应用回主窗口缓存与设置；设置无变化时不写盘。"""
         mw = self._mw
+        before = mw.settings.snapshot()
         # DPI
         mw._adv_dpi_x = self.sp_dpi_x.value()
         mw._adv_dpi_y = self.sp_dpi_y.value()
         # 格式相关
-        if self._fmt in ('jpg','jpeg'):
-            mw._adv_jpeg_progressive = bool(self.chk_jpg_prog.isChecked())
-            mw._adv_jpeg_optimize = bool(self.chk_jpg_opt.isChecked())
-            mw.settings.default_jpeg_progressive = mw._adv_jpeg_progressive
-            mw.settings.default_jpeg_optimize = mw._adv_jpeg_optimize
-        elif self._fmt == 'png':
-            mw._adv_png_optimize = bool(self.chk_png_opt.isChecked())
-            mw.settings.default_png_optimize = mw._adv_png_optimize
-        elif self._fmt == 'webp':
-            mw._adv_webp_lossless = bool(self.chk_webp_lossless.isChecked())
-            mw._adv_webp_method = int(self.sl_webp_method.value())
-            mw.settings.default_webp_lossless = mw._adv_webp_lossless
-            mw.settings.default_webp_method = mw._adv_webp_method
-        elif self._fmt in ('tif','tiff'):
-            mw._adv_tiff_compression = self.cmb_tiff_comp.currentText()
-            mw.settings.default_tiff_compression = mw._adv_tiff_compression
+        if self._handlers is not None:
+            getattr(self, self._handlers[1])(mw)
         # 通用默认写回
         mw.settings.default_dpi = (mw._adv_dpi_x, mw._adv_dpi_y)
-        AppSettings.save(mw.settings)
+        if mw.settings.snapshot() != before:
+            AppSettings.save(mw.settings)
+
+
+class ThumbTask(QRunnable):
+    """缩略图解码任务：在Qt线程池中执行，结果经信号总线回到UI线程。"""
+
+    def __init__(self, fn, paused: threading.Event) -> None:
+        super().__init__()
+        self._fn = fn
+        self._paused = paused
+
+    def run(self) -> None:
+        if self._paused.is_set():
+            return
+        try:
+            self._fn()
+        except Exception:
+            pass
+
+
+class ThumbPool:
+    """缩略图线程池：在专用 QThreadPool 之上增加“暂停”标志，用于两阶段关闭。
+
+    - 暂停后新出队的任务直接跳过，不再开始解码
+    - 关闭时先暂停并清空排队中的任务，不等待执行中的任务（不阻塞UI线程）
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_workers)
+        self._paused = threading.Event()
+
+    @property
+    def paused(self) -> bool:
+        return self._paused.is_set()
+
+    def submit(self, fn) -> None:
+        self._pool.start(ThumbTask(fn, self._paused))
+
+    def shutdown(self) -> None:
+        self._paused.set()
+        self._pool.clear()  # 仅移除尚未开始的任务
+
+
+class JobModel(QAbstractTableModel):
+    """队列数据模型：各列显示数据按列分别存放（列式存储），供 QTreeView 渲染。
+
+    行更新只改对应列表项并发出一次 dataChanged；缩略图以 DecorationRole 提供。
+    所有行等高（视图开启 uniformRowHeights），行高即缩略图列宽，缩略图在方形区域内等比绘制。
+    """
+
+    HEADERS = ["缩略图", "名称", "尺寸", "大小", "预估", "状态", "进度", "错误"]
+    STATUS_COLORS = {
+        JobStatus.WAITING: '#6B7280',
+        JobStatus.RUNNING: '#2563EB',
+        JobStatus.PAUSED: '#F59E0B',
+        JobStatus.COMPLETED: '#16A34A',
+        JobStatus.FAILED: '#DC2626',
+        JobStatus.CANCELLED: '#9CA3AF',
+    }
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._brushes = {st: QBrush(QColor(c)) for st, c in self.STATUS_COLORS.items()}
+        self._names: list[str] = []
+        self._dims: list[str] = []
+        self._sizes: list[str] = []
+        self._estimates: list[str] = []
+        self._status: list[JobStatus] = []
+        self._progress: list[int] = []
+        self._errors: list[str] = []
+        # 真实缩略图；尚未加载/已释放的行为None，绘制时统一返回共享占位图
+        self._icons: list[Optional[QIcon]] = []
+        self._placeholder = QIcon()
+        self._row_hint = QSize(48, 48)
+        # 当前持有真实缩略图的行（远离视口时可释放回占位图）
+        self._live: set[int] = set()
+        # 纯文本列按列号直接取表（状态/进度需格式化，单独处理）；对齐值只计算一次
+        self._text_cols = (None, self._names, self._dims, self._sizes, self._estimates, None, None, self._errors)
+        self._center = int(Qt.AlignHCenter | Qt.AlignVCenter)
+
+    # ---- Qt 模型接口 ----
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if orientation != Qt.Horizontal or not (0 <= section < len(self.HEADERS)):
+            return None
+        if role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        if role == Qt.TextAlignmentRole and section == 6:
+            return self._center
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        r, c = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            col = self._text_cols[c]
+            if col is not None:
+                return col[r]
+            if c == 5:
+                return STATUS_TEXT.get(self._status[r], "-")
+            if c == 6:
+                return f"{self._progress[r]}%"
+            return None
+        if c == 0:
+            if role == Qt.DecorationRole:
+                icon = self._icons[r]
+                return self._placeholder if icon is None else icon
+            if role == Qt.SizeHintRole:
+                return self._row_hint
+        elif c == 5 and role == Qt.ForegroundRole:
+            return self._brushes.get(self._status[r])
+        elif c == 6 and role == Qt.TextAlignmentRole:
+            return self._center
+        return None
+
+    # ---- 数据更新 ----
+    def append_jobs(self, jobs: List[JobItem], icon: QIcon, hint: QSize) -> None:
+        first = len(self._names)
+        self._row_hint = hint
+        self._placeholder = icon
+        self.beginInsertRows(QModelIndex(), first, first + len(jobs) - 1)
+        for job in jobs:
+            self._names.append(os.path.basename(job.src_path))
+            self._dims.append("-")
+            self._sizes.append("-")
+            self._estimates.append("-")
+            self._status.append(job.status)
+            self._progress.append(job.progress)
+            self._errors.append(job.error or "")
+            self._icons.append(None)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        for col in (self._names, self._dims, self._sizes, self._estimates, self._status,
+                    self._progress, self._errors, self._icons):
+            col.clear()
+        self._live.clear()
+        self.endResetModel()
+
+    def _emit_row(self, r: int, c0: int, c1: int) -> None:
+        self.dataChanged.emit(self.index(r, c0), self.index(r, c1))
+
+    def emit_rows(self, r0: int, r1: int, c0: int, c1: int) -> None:
+        """对 r0..r1 行、c0..c1 列发出一次合并的 dataChanged（批量写入后调用）。"""
+        r1 = min(r1, len(self._names) - 1)
+        if r0 <= r1:
+            self.dataChanged.emit(self.index(r0, c0), self.index(r1, c1))
+
+    def set_job(self, r: int, job: JobItem, dims: str, estimate: str, emit: bool = True) -> None:
+        """写入任务的动态列（尺寸/预估/状态/进度/错误）；文件大小只在 set_meta 写入一次。
+
+        emit 为假时由调用方合并通知。
+        """
+        self._dims[r] = dims
+        self._estimates[r] = estimate
+        self._status[r] = job.status
+        self._progress[r] = job.progress
+        self._errors[r] = job.error or ""
+        if emit:
+            self._emit_row(r, 2, 7)
+
+    def set_meta(self, r: int, dims: str, size: str, estimate: str, emit: bool = True) -> None:
+        self._dims[r] = dims
+        self._sizes[r] = size
+        self._estimates[r] = estimate
+        if emit:
+            self._emit_row(r, 2, 4)
+
+    def set_dims(self, r: int, dims: str) -> None:
+        if self._dims[r] == dims:
+            return
+        self._dims[r] = dims
+        self._emit_row(r, 2, 2)
+
+    def set_estimates(self, rows: List[int], texts: List[str]) -> None:
+        """按行号（升序）写入预估文本；只对实际变化的行区间发出一次 dataChanged。"""
+        cur = self._estimates
+        n = len(cur)
+        lo, hi = n, -1
+        for r, t in zip(rows, texts):
+            if r < n and cur[r] != t:
+                cur[r] = t
+                lo, hi = min(lo, r), max(hi, r)
+        self.emit_rows(lo, hi, 4, 4)
+
+    def set_thumb(self, r: int, icon: QIcon) -> None:
+        self._icons[r] = icon
+        self._live.add(r)
+        self._emit_row(r, 0, 0)
+
+    def status_at(self, r: int) -> JobStatus:
+        return self._status[r]
+
+    def has_thumb(self, r: int) -> bool:
+        return self._icons[r] is not None
+
+    def release_thumbs(self, lo: int, hi: int) -> None:
+        """把 lo..hi 之外的行换回共享占位图，释放其像素图引用（像素图仍可留在 QPixmapCache）。"""
+        far = [r for r in self._live if r < lo or r > hi]
+        if not far:
+            return
+        for r in far:
+            self._icons[r] = None
+        self._live.difference_update(far)
+        self.dataChanged.emit(self.index(min(far), 0), self.index(max(far), 0))
+
+    def relayout_thumbs(self, w: int, placeholder: QIcon) -> bool:
+        """按新列宽设置统一行高与共享占位图；无需逐行处理，开销与队列长度无关。
+        宽度未变时直接返回 False（拖动列宽时 Qt 会重复触发同一宽度）。"""
+        if self._row_hint.width() == w and self._placeholder is placeholder:
+            return False
+        self._row_hint = QSize(w, w)
+        self._placeholder = placeholder
+        # 含第0行的 dataChanged 会让视图按新行高重算统一行高
+        if self._names:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._names) - 1, 0))
+        return True
+
+
+class JobFilterProxy(QSortFilterProxyModel):
+    """“仅看失败”筛选：切换时只需一次 invalidateFilter()，无需逐行隐藏。"""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.only_failed = False
+        # 与原逐行隐藏一致：筛选只在切换时计算，转换过程中的状态变化不触发重新筛选
+        self.setDynamicSortFilter(False)
+
+    def set_only_failed(self, on: bool) -> None:
+        self.only_failed = bool(on)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # type: ignore[override]
+        if not self.only_failed:
+            return True
+        return self.sourceModel().status_at(source_row) == JobStatus.FAILED
+
+
+class ThumbDelegate(QStyledItemDelegate):
+    """缩略图列绘制：只画行背景与居中图标，跳过默认委托逐角色查询与文本布局。"""
+
+    def paint(self, painter, option, index) -> None:  # type: ignore[override]
+        view = self.parent()
+        view.style().drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, view)
+        icon = index.data(Qt.DecorationRole)
+        if icon is not None:
+            icon.paint(painter, option.rect, Qt.AlignCenter)
 
 
 class SignalBus(QObject):
     """跨线程信号总线：确保UI更新在主线程执行。"""
-    job_update = Signal(int, object)  # (index, JobItem)
     overall_update = Signal(int, int)
-    thumb_ready = Signal(int, str, object)  # (index, src_path, QImage)
+    thumb_ready = Signal(int, str, object, int, object)  # (index, src_path, QImage, 解码档位, 原图尺寸|None)
+    job_updates_pending = Signal()  # 有待合并刷新的任务更新
+    scan_batch = Signal(int, object, bool)  # (队列代号, 路径列表, 是否扫描结束)
+    meta_ready = Signal(object)  # [(index, JobItem, 字节数, 修改时间ns, 像素尺寸)]
 
 
 class MainWindow(QMainWindow):
@@ -314,6 +808,10 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("HEIC2any")
         self.resize(1200, 720)
+        # 开始/暂停按钮图标缓存，切换状态时复用，避免每次点击重新生成QIcon
+        self._icon_play = self.style().standardIcon(QStyle.SP_MediaPlay)
+        self._icon_pause = self.style().standardIcon(QStyle.SP_MediaPause)
+        self._icon_stop = self.style().standardIcon(QStyle.SP_BrowserStop)
 
         # 应用设置（可通过偏好设置修改并持久化）
         self.settings = AppSettings.load()
@@ -321,13 +819,40 @@ class MainWindow(QMainWindow):
         # 任务管理器（并发 + 控制）
         # 信号总线（Qt UI线程）
         self.bus = SignalBus(self)
-        self.bus.job_update.connect(self._on_job_update)
         self.bus.overall_update.connect(self._on_overall_update)
         self.bus.thumb_ready.connect(self._on_thumb_ready)
+        self.bus.job_updates_pending.connect(self._schedule_job_flush)
+        self.bus.scan_batch.connect(self._on_scan_batch)
+        self.bus.meta_ready.connect(self._on_meta_ready)
+        # 后台目录扫描：进行中的扫描数、本轮已添加数与取消标志
+        # 取消标志按队列代号区分：清空队列时置位并换新，扫描/元数据/预读等后台任务随之退出
+        self._scan_active = 0
+        self._scan_added = 0
+        self._scan_gen = 0
+        self._scan_cancel = threading.Event()
+
+        # 任务进度合并刷新：工作线程只写入待刷新表，UI线程约30Hz统一刷新一次
+        self._pending_job_updates: dict[int, JobItem] = {}
+        self._pending_lock = threading.Lock()
+        self._last_job_state: dict[int, tuple] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.timeout.connect(self._flush_job_updates)
+
+        # 预估列/时间预估节流：窗口内的连续变更（拖动滑块、连续切换格式）只刷新一次
+        self._est_timer = QTimer(self)
+        self._est_timer.setSingleShot(True)
+        self._est_timer.setInterval(120)
+        self._est_timer.timeout.connect(self._refresh_estimates)
+        self._time_est_timer = QTimer(self)
+        self._time_est_timer.setSingleShot(True)
+        self._time_est_timer.setInterval(150)
+        self._time_est_timer.timeout.connect(self._refresh_time_estimate)
 
         # 核心事件总线（跨线程），控制层仅发布事件；此处桥接到Qt信号用于UI渲染
         self.core_bus = EventBus()
-        self.core_bus.subscribe(EventType.JOB_UPDATED, lambda d: self.bus.job_update.emit(int(d.get('index', -1)), d.get('job')))
+        self.core_bus.subscribe(EventType.JOB_UPDATED, self._enqueue_job_update)
         self.core_bus.subscribe(EventType.OVERALL_UPDATED, lambda _d: self.bus.overall_update.emit(0, 0))
 
         self.task_manager = TaskManager(
@@ -382,23 +907,47 @@ class MainWindow(QMainWindow):
         # 选择的输出目录
         self.output_dir = self.settings.default_output_dir
         # 启动时不主动创建/弹窗，仅记录路径；在开始转换或用户主动修改时再校验
+        # 转换日志句柄：一次运行内保持打开，逐行 flush；输出目录变化时自动重开
+        self._log_fh = None
+        self._log_path = ""
+
+        # 设置延迟保存：频繁变动的字段（如最近输入目录）合并为一次写盘
+        self._settings_dirty = False
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(1000)
+        self._settings_save_timer.timeout.connect(self._flush_settings)
+
+        # 工作目录在会话内不变，启动时取一次
+        self._cwd_cached = os.getcwd()
 
         # 内部数据
         self.jobs: List[JobItem] = []
+        # 各行最近一次渲染的状态与各状态计数，总进度按增量维护，无需每次遍历全部任务
+        self._job_status: List[JobStatus] = []
+        self._status_counts: dict[JobStatus, int] = {s: 0 for s in JobStatus}
+        # 等待/暂停中的行号：预估刷新只需遍历这些行（其余行的预估不受检查器覆盖影响）
+        self._waiting: set[int] = set()
+        # 已在队列中的源路径，追加时去重
+        self._job_paths: set[str] = set()
         self._selected_indices: List[int] = []
         # 缩略图后台线程池（小并发，减少IO阻塞）
-        from concurrent.futures import ThreadPoolExecutor
-        self._thumb_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="thumbs")
+        self._thumb_pool = ThumbPool(max_workers=max(2, (os.cpu_count() or 2) // 2))
         self._start_button_state = "start"  # start|pause|resume
         self._really_quit = False
         self._notified_all_done = False
-        # 缩略图缓存与标签引用（按行索引）
-        self._thumb_cache: dict[int, QImage] = {}
-        self._thumb_labels: dict[int, QLabel] = {}
+        # 缩略图缓存：应用级 QPixmapCache（上限64MB，自动淘汰），以 QPixmapCache.Key 句柄索引，
+        # 同一源文件的多行共享一份像素图；此处按LRU记录 路径 -> (解码档位, 修改时间ns, 句柄)。
+        # 清空队列后保留句柄，同一文件（修改时间未变）再次加入时无需重新解码
+        QPixmapCache.setCacheLimit(65536)
+        self._thumb_handles: OrderedDict[str, tuple[int, int, QPixmapCache.Key]] = OrderedDict()
+        self._thumb_handles_max = 1024
+        # 源文件修改时间（由后台元数据读取回填），用于判定缓存缩略图是否过期
+        self._src_mtime: dict[str, int] = {}
         # 正在加载的索引，避免重复提交
         self._thumb_loading: set[int] = set()
-        # 缩略图缓存
-        self._thumb_cache: dict[int, QImage] = {}
+        # 已提交预读的行，避免滚动时重复预读
+        self._prefetched: set[int] = set()
 
         # 高级设置缓存（从AppSettings装载）
         self._adv_jpeg_progressive = bool(getattr(self.settings, 'default_jpeg_progressive', False))
@@ -409,11 +958,19 @@ class MainWindow(QMainWindow):
         self._adv_tiff_compression = str(getattr(self.settings, 'default_tiff_compression', 'tiff_deflate'))
         self._adv_dpi_x, self._adv_dpi_y = self.settings.default_dpi
 
+        # 通知入口：关闭通知时绑定为空操作，调用方无需再读设置
+        self._bind_notify()
+
+        # 托盘通知图标枚举（预先取出，避免每次通知时查找）
+        self._icon_info = QSystemTrayIcon.MessageIcon.Information
+        self._icon_crit = QSystemTrayIcon.MessageIcon.Critical
+
         # 系统托盘
+        self._topbar_refresh_pending = False
         self._init_tray()
 
-        # 初始化UI状态
-        self._refresh_topbar_states()
+        # 初始化UI状态（与托盘初始化的刷新合并为事件循环中的一次）
+        self._queue_topbar_refresh()
         self._refresh_inspector_preview()
         
     def _make_card(self, title: str, link_text: str | None = None, link_cb=None) -> tuple[QWidget, QFormLayout]:
@@ -451,13 +1008,13 @@ class MainWindow(QMainWindow):
     def _refresh_topbar_states(self) -> None:
         if self._start_button_state == "start":
             self._btn_start.setText("开始")
-            self._btn_start.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+            self._btn_start.setIcon(self._icon_play)
         elif self._start_button_state == "pause":
             self._btn_start.setText("暂停")
-            self._btn_start.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+            self._btn_start.setIcon(self._icon_pause)
         else:
             self._btn_start.setText("继续")
-            self._btn_start.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+            self._btn_start.setIcon(self._icon_play)
         # 同步托盘菜单文案
         if hasattr(self, '_act_tray_toggle'):
             if self._start_button_state == "start":
@@ -467,21 +1024,27 @@ class MainWindow(QMainWindow):
             else:
                 self._act_tray_toggle.setText("继续")
 
+    def _queue_topbar_refresh(self) -> None:
+        """合并同一事件循环周期内的多次刷新请求，下一轮空闲时只刷新一次。"""
+        if self._topbar_refresh_pending:
+            return
+        self._topbar_refresh_pending = True
+        QTimer.singleShot(0, self._do_topbar_refresh)
+
+    def _do_topbar_refresh(self) -> None:
+        self._topbar_refresh_pending = False
+        self._refresh_topbar_states()
+
     def _on_click_start_pause_resume(self) -> None:
         if self._start_button_state == "start":
             # 空队列防护：无文件或无待处理项时提示且不改变按钮状态
-            pending = [j for j in self.jobs if j.status in (JobStatus.WAITING, JobStatus.PAUSED)]
-            if len(pending) == 0:
+            counts = self._status_counts
+            if counts[JobStatus.WAITING] + counts[JobStatus.PAUSED] == 0:
                 self._show_info("队列为空，请先添加文件")
                 return
             # 日志头
             if getattr(self.settings, 'export_convert_log', False):
-                try:
-                    with open(os.path.join(self.output_dir, 'cconvert.log'), 'a', encoding='utf-8') as f:
-                        from datetime import datetime
-                        f.write(f"\n=== Start {datetime.now().isoformat(timespec='seconds')} ===\n")
-                except Exception:
-                    pass
+                self._write_convert_log(f"\n=== Start {datetime.now().isoformat(timespec='seconds')} ===\n")
             # 解析并发设置（Auto/手动）
             if hasattr(self, 'rb_auto') and self.rb_auto.isChecked():
                 self.ins_threads.setValue(self._auto_threads)
@@ -504,27 +1067,44 @@ class MainWindow(QMainWindow):
 
     def _on_click_stop(self) -> None:
         self.task_manager.stop()
+        self._close_convert_log()
         self._start_button_state = "start"
         self._refresh_topbar_states()
 
     def _action_clear_queue(self) -> None:
         self.task_manager.stop()
+        # 作废本代的后台扫描/元数据/预读任务；迟到的扫描批次按代号丢弃
+        self._scan_cancel.set()
+        self._scan_cancel = threading.Event()
+        self._scan_gen += 1
+        if self._scan_active:
+            self._scan_active = 0
+            self._empty.setText("拖拽或点击添加文件")
+            try:
+                self.statusBar().clearMessage()
+            except Exception:
+                pass
         self.jobs.clear()
-        self.queue.clear()
+        self._job_status.clear()
+        self._status_counts = {s: 0 for s in JobStatus}
+        self._waiting.clear()
+        self._job_paths.clear()
+        with self._pending_lock:
+            self._pending_job_updates.clear()
+            self._last_job_state.clear()
+        self.queue_model.clear()
         self._update_total_progress()
         self._notified_all_done = False
         self._update_empty_placeholder()
-        try:
-            self._thumb_cache.clear()
-            self._thumb_labels.clear()
-        except Exception:
-            pass
+        self._src_mtime.clear()
+        self._prefetched.clear()
 
     def _action_reset_defaults(self) -> None:
         self.settings = AppSettings()  # 恢复默认
         AppSettings.save(self.settings)
+        self._bind_notify()
         self._load_settings_into_inspector()
-        self._refresh_inspector_preview()
+        self._on_inspector_changed()
         # 同步高级设置缓存
         self._adv_jpeg_progressive = self.settings.default_jpeg_progressive
         self._adv_jpeg_optimize = self.settings.default_jpeg_optimize
@@ -546,6 +1126,7 @@ class MainWindow(QMainWindow):
             if env is None:
                 self._show_info("未选择环境","环境")
                 return
+            from heic2any.utils.conda import test_env_dependencies
             okdep, msg = test_env_dependencies(env)
             # 保存到设置
             self.settings.selected_env_prefix = env.prefix
@@ -566,8 +1147,8 @@ class MainWindow(QMainWindow):
         btn_start = QPushButton("开始"); btn_start.setObjectName("btnStart"); btn_start.setFixedHeight(48); btn_start.setMinimumWidth(120)
         btn_stop = QPushButton("停止"); btn_stop.setObjectName("btnStop"); btn_stop.setFixedHeight(48); btn_stop.setMinimumWidth(120)
         btn_clear = QPushButton("清空"); btn_clear.setFixedHeight(48); btn_clear.setMinimumWidth(96)
-        btn_start.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-        btn_stop.setIcon(self.style().standardIcon(QStyle.SP_BrowserStop))
+        btn_start.setIcon(self._icon_play)
+        btn_stop.setIcon(self._icon_stop)
         btn_start.clicked.connect(self._on_click_start_pause_resume)
         btn_stop.clicked.connect(self._on_click_stop)
         btn_clear.clicked.connect(self._action_clear_queue)
@@ -592,20 +1173,33 @@ class MainWindow(QMainWindow):
         header.addWidget(btn_choose_out)
         header.addWidget(btn_settings)
 
-        self.queue = QTreeWidget()
-        self.queue.setColumnCount(8)
-        self.queue.setHeaderLabels(["缩略图", "名称", "尺寸", "大小", "预估", "状态", "进度", "错误"])
+        self.queue_model = JobModel(self)
+        # 共享占位图标：(列宽, 图标)
+        self._placeholder_cache: tuple[int, QIcon] = (0, QIcon())
+        # 视图挂在筛选代理上；模型行号与 self.jobs 下标一致，视图行号需经代理映射
+        self.queue_proxy = JobFilterProxy(self)
+        self.queue_proxy.setSourceModel(self.queue_model)
+        self.queue = QTreeView()
+        self.queue.setModel(self.queue_proxy)
         self.queue.setRootIsDecorated(False)
         self.queue.setAlternatingRowColors(True)
-        self.queue.setSelectionMode(QTreeWidget.ExtendedSelection)
+        # 行高统一（= 缩略图列宽），视图按 行号×行高 计算几何，无需逐行询问 sizeHint
+        self.queue.setUniformRowHeights(True)
+        self.queue.setSelectionMode(QAbstractItemView.ExtendedSelection)
         # 初始图标尺寸以列宽推导（仍设置默认以便非自定义路径时有尺寸）
         self.queue.setIconSize(QSize(48, 48))
+        self.queue.setItemDelegateForColumn(0, ThumbDelegate(self.queue))
         self.queue.setAcceptDrops(True)
         self.queue.dragEnterEvent = self._drag_enter
         self.queue.dragMoveEvent = self._drag_move
         self.queue.dropEvent = self._drop
-        self.queue.itemSelectionChanged.connect(self._on_selection_changed)
+        self.queue.selectionModel().selectionChanged.connect(lambda *_: self._on_selection_changed())
         try:
+            # 拖动列宽时每个像素都会触发 sectionResized，行高/缩略图重算合并到停止拖动后执行一次
+            self._resize_debounce = QTimer(self)
+            self._resize_debounce.setSingleShot(True)
+            self._resize_debounce.setInterval(80)
+            self._resize_debounce.timeout.connect(self._update_all_row_heights)
             self.queue.header().sectionResized.connect(self._on_queue_section_resized)
             self._update_all_row_heights()
         except Exception:
@@ -631,6 +1225,8 @@ class MainWindow(QMainWindow):
         def _resize(ev):
             try:
                 self._empty.setGeometry(self.queue.viewport().rect())
+                # 视口变高后可能露出新行，节流请求可视行缩略图
+                self._schedule_visible_thumbs()
             except Exception:
                 pass
             _orig_resize(ev)
@@ -640,9 +1236,8 @@ class MainWindow(QMainWindow):
         self.queue.viewport().installEventFilter(self)
         try:
             # 监听滚动条，滚动时节流触发可视缩略图加载
-            from PySide6.QtCore import QTimer
             self._thumb_vis_timer = QTimer(self); self._thumb_vis_timer.setSingleShot(True)
-            self.queue.verticalScrollBar().valueChanged.connect(lambda _v: (self._thumb_vis_timer.start(60)))
+            self.queue.verticalScrollBar().valueChanged.connect(self._schedule_visible_thumbs)
             self._thumb_vis_timer.timeout.connect(self._ensure_visible_thumbs)
         except Exception:
             pass
@@ -665,46 +1260,71 @@ class MainWindow(QMainWindow):
             e.ignore()
 
     def _drop(self, e):  # type: ignore
-        paths = []
-        for url in e.mimeData().urls():
-            p = url.toLocalFile()
-            if os.path.isdir(p):
-                for root, _, files in os.walk(p):
-                    for fn in files:
-                        if fn.lower().endswith(('.heic', '.heif')):
-                            paths.append(os.path.join(root, fn))
-            else:
-                if p.lower().endswith(('.heic', '.heif')):
-                    paths.append(p)
-        self._append_jobs(paths)
+        # 与“添加文件夹”一致：扫描进行中不叠加新的扫描（多路扫描共用进行中状态会提前复位）
+        if self._scan_active:
+            e.ignore()
+            self._show_info("正在扫描文件夹，请稍候")
+            return
+        roots = [url.toLocalFile() for url in e.mimeData().urls()]
+        self._start_scan([p for p in roots if p])
+
+    def _start_scan(self, roots: List[str]) -> None:
+        """在后台线程扫描文件/文件夹，结果分批回到UI线程追加到队列。"""
+        if self._scan_active == 0:
+            self._scan_added = 0
+        self._scan_active += 1
+        self._empty.setText("正在扫描…")
+        try:
+            self.statusBar().showMessage("正在扫描文件夹…")
+        except Exception:
+            pass
+        gen = self._scan_gen
+        emit = self.bus.scan_batch.emit
+        cancel = self._scan_cancel
+        QThreadPool.globalInstance().start(lambda: _scan_heic_paths(roots, lambda b, d: emit(gen, b, d), cancel))
+
+    def _on_scan_batch(self, gen: int, paths: List[str], done: bool) -> None:
+        if gen != self._scan_gen:
+            return  # 队列已清空，丢弃旧扫描的结果
+        if paths:
+            self._scan_added += self._append_jobs(paths, quiet=True)
+        if not done:
+            return
+        self._scan_active = max(0, self._scan_active - 1)
+        if self._scan_active == 0:
+            self._empty.setText("拖拽或点击添加文件")
+            try:
+                self.statusBar().clearMessage()
+            except Exception:
+                pass
+            if self._scan_added == 0:
+                self._show_info("未添加任何HEIC文件")
 
     def _on_selection_changed(self) -> None:
-        sel = self.queue.selectedItems()
-        indices: List[int] = []
-        for it in sel:
-            idx = it.data(0, Qt.UserRole)
-            if idx is not None:
-                indices.append(int(idx))
-        self._selected_indices = sorted(indices)
+        to_src = self.queue_proxy.mapToSource
+        rows = {to_src(ix).row() for ix in self.queue.selectionModel().selectedRows()}
+        self._selected_indices = sorted(rows)
         self._load_selected_to_inspector()
 
     def eventFilter(self, obj, event):  # type: ignore
         # 点击左侧空白区域：左键→直接选择文件；右键→弹出菜单（文件/文件夹）
+        # 仅关心鼠标按下/释放，其余高频事件（重绘、移动等）直接放行
+        et = event.type()
+        if et not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return super().eventFilter(obj, event)
         try:
             if obj is self.queue.viewport():
-                # 滚动/重绘/鼠标释放时确保可视行的缩略图已请求加载
-                if event.type() in (QEvent.Paint, QEvent.Wheel, QEvent.Resize):
-                    self._ensure_visible_thumbs()
                 # 空白区域按下即触发（左键打开、右键菜单），避免仅在释放时偶发未触发
-                if event.type() == QEvent.MouseButtonPress:
+                if et == QEvent.MouseButtonPress:
                     pos = event.pos()
-                    if self.queue.itemAt(pos) is None:
+                    if not self.queue.indexAt(pos).isValid():
                         if event.button() == Qt.RightButton:
                             menu = QMenu(self)
                             act_files = QAction("添加文件", self)
                             act_files.triggered.connect(self._add_files)
                             act_dir = QAction("添加文件夹", self)
                             act_dir.triggered.connect(self._add_dir)
+                            act_dir.setEnabled(self._scan_active == 0)
                             menu.addAction(act_files)
                             menu.addAction(act_dir)
                             gp = self.queue.viewport().mapToGlobal(pos)
@@ -712,16 +1332,17 @@ class MainWindow(QMainWindow):
                         else:
                             self._add_files()
                         return True
-                if event.type() == QEvent.MouseButtonRelease and event.buttons() == Qt.NoButton:
+                if et == QEvent.MouseButtonRelease and event.buttons() == Qt.NoButton:
                     pos = event.pos()
                     # 若点击位置没有条目，则展示菜单
-                    if self.queue.itemAt(pos) is None:
+                    if not self.queue.indexAt(pos).isValid():
                         if event.button() == Qt.RightButton:
                             menu = QMenu(self)
                         act_files = QAction("添加文件", self)
                         act_files.triggered.connect(self._add_files)
                         act_dir = QAction("添加文件夹", self)
                         act_dir.triggered.connect(self._add_dir)
+                        act_dir.setEnabled(self._scan_active == 0)
                         menu.addAction(act_files)
                         menu.addAction(act_dir)
                         gp = self.queue.viewport().mapToGlobal(pos)
@@ -737,13 +1358,18 @@ class MainWindow(QMainWindow):
         """根据队列是否为空显示/隐藏内置提示。"""
         try:
             if hasattr(self, 'queue') and hasattr(self, '_empty'):
-                self._empty.setGeometry(self.queue.viewport().rect())
-                self._empty.setVisible(self.queue.topLevelItemCount() == 0)
+                empty = self.queue_model.rowCount() == 0
+                # 有任务时提示保持隐藏，无需再查询视口尺寸
+                if empty:
+                    self._empty.setGeometry(self.queue.viewport().rect())
+                self._empty.setVisible(empty)
         except Exception:
             pass
 
     def _apply_column_visibility(self) -> None:
         """根据设置隐藏或显示输入信息列，避免不必要的计算。"""
+        # 三列的显隐合并为一次重绘
+        self.queue.setUpdatesEnabled(False)
         try:
             # 列索引：2=尺寸, 3=大小, 4=预估
             self.queue.setColumnHidden(2, not getattr(self.settings, 'show_col_dims', True))
@@ -751,27 +1377,35 @@ class MainWindow(QMainWindow):
             self.queue.setColumnHidden(4, not getattr(self.settings, 'show_col_estimate', True))
         except Exception:
             pass
+        finally:
+            self.queue.setUpdatesEnabled(True)
+            self.queue.viewport().update()
 
     def _apply_failed_filter(self) -> None:
         """仅看失败筛选应用。"""
         try:
             only_failed = getattr(self, 'chk_only_failed', None) and self.chk_only_failed.isChecked()
-            for i in range(self.queue.topLevelItemCount()):
-                it = self.queue.topLevelItem(i)
-                job = self.jobs[i]
-                it.setHidden(only_failed and job.status != JobStatus.FAILED)
+            self.queue_proxy.set_only_failed(bool(only_failed))
+            self._thumb_vis_timer.start(0)
         except Exception:
             pass
 
     def _retry_failed(self) -> None:
+        if not self._status_counts[JobStatus.FAILED]:
+            self._apply_failed_filter()
+            return
         cnt = 0
+        lo, hi = len(self.jobs), -1
         for i, j in enumerate(self.jobs):
             if j.status == JobStatus.FAILED:
                 j.status = JobStatus.WAITING
                 j.error = None
                 j.progress = 0
-                self._on_job_update(i, j)
+                self._on_job_update(i, j, emit=False)
+                lo, hi = min(lo, i), max(hi, i)
                 cnt += 1
+        self.queue_model.emit_rows(lo, hi, 2, 7)
+        self._update_total_progress()
         if cnt:
             self._show_info(f"已重置 {cnt} 个失败项为等待状态")
         self._apply_failed_filter()
@@ -832,38 +1466,43 @@ class MainWindow(QMainWindow):
         files, _ = QFileDialog.getOpenFileNames(
             self, "选择HEIC文件", start_dir, "HEIC 文件 (*.heic *.heif);;所有文件 (*.*)")
         self._append_jobs(files)
-        # 记录最近输入目录
+        # 记录最近输入目录（对话框刚选中的文件，其所在目录必然存在，无需再访问文件系统）
         if files:
-            base = os.path.dirname(files[0])
-            if os.path.isdir(base):
-                self.settings.last_input_dir = base
-                AppSettings.save(self.settings)
+            self.settings.last_input_dir = os.path.dirname(files[0])
+            self._mark_settings_dirty()
 
     def _add_dir(self) -> None:
+        # 扫描进行中不再叠加新的文件夹扫描
+        if self._scan_active:
+            self._show_info("正在扫描文件夹，请稍候")
+            return
         start_dir = self._ensure_valid_input_dir()
         d = QFileDialog.getExistingDirectory(self, "选择文件夹", start_dir)
         if not d:
             return
-        # 记录最近输入目录
-        if os.path.isdir(d):
-            self.settings.last_input_dir = d
-            AppSettings.save(self.settings)
-        paths: List[str] = []
-        for root, _, files in os.walk(d):
-            for fn in files:
-                if fn.lower().endswith(('.heic', '.heif')):
-                    paths.append(os.path.join(root, fn))
-        self._append_jobs(paths)
-
-    def _append_jobs(self, paths: List[str]) -> None:
-        added = 0
+        # 记录最近输入目录（对话框返回的目录已确认存在）
+        self.settings.last_input_dir = d
+        self._mark_settings_dirty()
+        self._start_scan([d])
+
+    def _append_jobs(self, paths: List[str], quiet: bool = False) -> int:
+        """追加任务并返回实际添加数；quiet 为真时不提示“未添加”（分批扫描由调用方汇总提示）。
+
+        先构造全部任务，再一次性插入模型（单次 rowsInserted），避免逐行布局重算。
+        """
+        # 按当前检查器设置初始化新任务的导出格式与关键参数（整批只读取一次控件）
+        fmt = self.ins_format.currentText().lower()
+        req_size = (self.ins_width.value(), self.ins_height.value())
+        keep_aspect = bool(self.btn_lock.isChecked())
+        new_jobs: List[JobItem] = []
+        seen = self._job_paths
         for p in paths:
-            if not os.path.isfile(p):
+            # 路径来自 scandir 扫描或文件对话框，文件类型已确认，仅按集合去重
+            if not p or p in seen:
                 continue
-            item = JobItem.from_source(p)
-            item.export_dir = self.output_dir
-            # 新增：按当前检查器设置初始化新任务的导出格式与关键参数
-            fmt = self.ins_format.currentText().lower()
+            seen.add(p)
+            # 文件大小/像素尺寸由后台读取后回填，UI线程不做任何stat
+            item = JobItem(src_path=p, export_dir=self.output_dir)
             item.export_format = fmt
             if fmt in ("jpg", "jpeg"):
                 item.quality = self.jpeg_quality.value()
@@ -880,34 +1519,37 @@ class MainWindow(QMainWindow):
                 elif fmt in ('tif','tiff'):
                     item.tiff_compression = self._adv_tiff_compression
             # 尺寸与比例
-            wv, hv = self.ins_width.value(), self.ins_height.value()
-            item.req_size = (wv, hv)
-            item.keep_aspect = bool(self.btn_lock.isChecked())
-            self.jobs.append(item)
-            idx_new = len(self.jobs)-1
-            row = self._create_row(item, idx_new)
-            self.queue.addTopLevelItem(row)
-            # 现在item已加入tree，再挂载缩略图标签
-            self._attach_thumb_widget(row, idx_new)
-            added += 1
+            item.req_size = req_size
+            item.keep_aspect = keep_aspect
+            new_jobs.append(item)
+        added = len(new_jobs)
+        if new_jobs:
+            first = len(self.jobs)
+            self.jobs.extend(new_jobs)
+            for k, item in enumerate(new_jobs, first):
+                self._job_status.append(item.status)
+                self._status_counts[item.status] += 1
+                if item.status in (JobStatus.WAITING, JobStatus.PAUSED):
+                    self._waiting.add(k)
+            # 先放占位图标；真实缩略图在插入后由 _ensure_visible_thumbs 仅对可视行请求
+            w = self._thumb_target_width()
+            self._sync_icon_size(w)
+            self.queue_model.append_jobs(new_jobs, self._placeholder_icon(w), QSize(w, w))
+            pending = [(first + k, self.jobs[first + k]) for k in range(added)]
+            emit = self.bus.meta_ready.emit
+            cancel = self._scan_cancel
+            QThreadPool.globalInstance().start(lambda: _read_job_metadata(pending, emit, cancel))
         if added > 0:
             self._update_empty_placeholder()
-            # 初次添加后，确保可见区域的缩略图被请求加载
+            # 可见行缩略图请求推迟到事件循环空闲时统一处理，连续多批扫描结果只触发一次
             try:
-                self._ensure_visible_thumbs()
+                self._thumb_vis_timer.start(0)
             except Exception:
                 pass
-        if added == 0:
+        if added == 0 and not quiet:
             self._show_info("未添加任何HEIC文件")
         self._update_total_progress()
-
-    def _create_row(self, job: JobItem, index: int) -> QTreeWidgetItem:
-        it = QTreeWidgetItem(["", os.path.basename(job.src_path), job.size_text(), self._human_bytes(job.src_bytes), self._estimate_output_text(job), job.status_text(), "0%", ""]) 
-        it.setData(0, Qt.UserRole, index)
-        it.setTextAlignment(6, Qt.AlignHCenter | Qt.AlignVCenter)
-        # 异步加载真实缩略图（QImage），回到主线程设置
-        self._request_thumb_for(index)
-        return it
+        return added
 
     # ---------- 右侧检查器 ----------
     def _build_inspector(self) -> QWidget:
@@ -1026,8 +1668,7 @@ class MainWindow(QMainWindow):
         # 复制按钮
         btn_copy = QToolButton(); btn_copy.setText('复制'); btn_copy.setObjectName('stepBtn')
         def _copy_preview():
-            from PySide6.QtWidgets import QApplication as QApp
-            QApp.clipboard().setText(self.ins_preview.text())
+            QApplication.clipboard().setText(self.ins_preview.text())
         btn_copy.clicked.connect(_copy_preview)
         name_form.addRow('模板', rowt)
         prev_row = QWidget(); prl = QHBoxLayout(prev_row); prl.setContentsMargins(0,0,0,0); prl.setSpacing(8)
@@ -1048,6 +1689,10 @@ class MainWindow(QMainWindow):
         self.btn_thr_plus = QToolButton(); self.btn_thr_plus.setObjectName('stepBtn'); self.btn_thr_plus.setText('+'); self.btn_thr_plus.setEnabled(False)
         self.btn_thr_minus.clicked.connect(lambda: self.ins_threads.setValue(max(self.ins_threads.minimum(), self.ins_threads.value()-1)))
         self.btn_thr_plus.clicked.connect(lambda: self.ins_threads.setValue(min(self.ins_threads.maximum(), self.ins_threads.value()+1)))
+        # 线程控件引用与上次状态缓存，切换时仅在状态变化时写入
+        self._thread_widgets = [self.ins_threads, self.btn_thr_minus, self.btn_thr_plus]
+        self._last_thread_en: Optional[bool] = None
+        self._last_auto_threads: Optional[int] = None
         # 行排布
         thr_row = QWidget(); trl = QHBoxLayout(thr_row); trl.setContentsMargins(0,0,0,0); trl.setSpacing(8)
         trl.addWidget(self.rb_auto)
@@ -1074,29 +1719,33 @@ class MainWindow(QMainWindow):
         self._on_format_changed(self.ins_format.currentText())
         # 预览实时更新
         try:
-            self.ins_template.textChanged.connect(lambda _: self._refresh_inspector_preview())
-            self.jpeg_quality.valueChanged.connect(lambda _: self._refresh_inspector_preview())
-            self.png_level.valueChanged.connect(lambda _: self._refresh_inspector_preview())
-            self.other_quality.valueChanged.connect(lambda _: self._refresh_inspector_preview())
-            self.ins_width.valueChanged.connect(lambda _: self._refresh_inspector_preview())
-            self.ins_height.valueChanged.connect(lambda _: self._refresh_inspector_preview())
-            # 估算实时更新（轻量，基于文件大小与格式参数）
-            self.ins_format.currentTextChanged.connect(lambda _: self._refresh_estimates_throttled())
-            self.jpeg_quality.valueChanged.connect(lambda _: self._refresh_estimates_throttled())
-            self.png_level.valueChanged.connect(lambda _: self._refresh_estimates_throttled())
-            self.other_quality.valueChanged.connect(lambda _: self._refresh_estimates_throttled())
-            # 时间预估联动（格式与线程）
-            self.ins_format.currentTextChanged.connect(lambda _: self._refresh_time_estimate_throttled())
-            self.jpeg_quality.valueChanged.connect(lambda _: self._refresh_time_estimate_throttled())
-            self.png_level.valueChanged.connect(lambda _: self._refresh_time_estimate_throttled())
-            self.other_quality.valueChanged.connect(lambda _: self._refresh_time_estimate_throttled())
+            self.ins_template.textChanged.connect(self._refresh_inspector_preview)
+            # 参数控件各只连一个槽：预览、体积预估与时间预估在其中统一（节流）刷新
+            for wdg in (self.jpeg_quality, self.png_level, self.other_quality, self.ins_width, self.ins_height):
+                wdg.valueChanged.connect(self._on_inspector_changed)
+            self.ins_format.currentTextChanged.connect(self._on_inspector_changed)
         except Exception:
             pass
         self._update_thread_controls()
         return w
 
+    def _on_inspector_changed(self, *_args) -> None:
+        # 批量装载设置期间不逐个控件刷新，由调用方装载结束后统一刷新一次
+        if self._inspector_loading:
+            return
+        self._refresh_inspector_preview()
+        self._refresh_estimates_throttled()
+        self._refresh_time_estimate_throttled()
+
     def _load_settings_into_inspector(self) -> None:
         # 将当前AppSettings装载进检查器
+        self._inspector_loading = True
+        try:
+            self._fill_inspector_from_settings()
+        finally:
+            self._inspector_loading = False
+
+    def _fill_inspector_from_settings(self) -> None:
         self.ins_format.setCurrentText(self.settings.default_format)
         # 三页的默认值
         self.jpeg_quality.setValue(min(95, max(1, self.settings.default_quality)))
@@ -1150,12 +1799,7 @@ class MainWindow(QMainWindow):
             n = int(n)
         except Exception:
             return "-"
-        units = ['B','KB','MB','GB','TB']
-        x = float(n)
-        for u in units:
-            if x < 1024 or u == units[-1]:
-                return f"{x:.1f}{u}" if u != 'B' else f"{int(x)}B"
-            x /= 1024.0
+        return _format_bytes(n)
 
     def _estimate_output_text(self, job: JobItem) -> str:
         """基于导出参数的粗略体积估算（避免解码）。
@@ -1197,46 +1841,23 @@ class MainWindow(QMainWindow):
         except Exception:
             w, h = 0, 0
 
-        # PNG：基于像素尺寸进行估算，解决严重低估问题
-        if fmt == 'png' and w > 0 and h > 0:
-            lvl = int(getattr(job, 'png_compress_level', 6) or 0)
-            lvl = max(0, min(9, lvl))
-            # 原始大小：RGB 每像素3字节，外加少量固定开销
-            raw = w * h * 3
-            overhead = 64 * 1024  # PNG 头/块等开销近似
-            # 压缩系数表（经验值，照片类内容）：0=1.00（无压缩）…9≈0.40
-            ratio_table = [1.00, 0.92, 0.85, 0.80, 0.75, 0.70, 0.60, 0.52, 0.46, 0.40]
-            ratio = ratio_table[lvl]
-            if bool(getattr(job, 'png_optimize', False)):
-                ratio *= 0.95
-            est = int(raw * ratio + overhead)
-            return self._human_bytes(est)
-
-        # 其他格式：退化到启发式（仍考虑尺寸缺失时的容错）
-        size = int(getattr(job, 'src_bytes', 0) or 0)
-        if size <= 0:
-            # 若没有源大小，则无法估算
-            return "-"
         try:
-            if fmt in ('jpg', 'jpeg'):
-                q = max(1, min(100, int(getattr(job, 'quality', 90))))
-                ratio = 0.6 + 1.2 * (q / 100.0)  # 0.6 .. 1.8
-            elif fmt == 'webp':
-                q = max(1, min(100, int(getattr(job, 'quality', 90))))
-                ratio = 0.5 + 1.0 * (q / 100.0)  # 0.5 .. 1.5
-            elif fmt in ('tif', 'tiff'):
-                c = str(getattr(job, 'tiff_compression', 'tiff_deflate'))
-                ratio = 1.4 if c != 'tiff_lzw' else 1.3
-            else:
-                ratio = 1.0
-            est = int(size * ratio)
-            return self._human_bytes(est)
+            lvl = int(getattr(job, 'png_compress_level', 6) or 0)
+            q = int(getattr(job, 'quality', 90))
         except Exception:
             return "-"
+        return _estimate_text(
+            fmt, int(w or 0), int(h or 0), lvl, bool(getattr(job, 'png_optimize', False)),
+            int(getattr(job, 'src_bytes', 0) or 0), q, str(getattr(job, 'tiff_compression', 'tiff_deflate')),
+        )
 
     def _refresh_estimates(self) -> None:
-        # 若设置中关闭预估显示，则不计算
-        if not getattr(self.settings, 'show_col_estimate', True):
+        # 若设置中关闭预估显示或列被隐藏，则不计算
+        if not getattr(self.settings, 'show_col_estimate', True) or self.queue.isColumnHidden(4):
+            return
+        # 仅等待/暂停的任务受检查器覆盖影响；其余行的预估已在任务更新时写入
+        rows = sorted(self._waiting)
+        if not rows:
             return
         # 当前检查器设置作为覆盖（仅对待处理项生效）
         fmt = (self.ins_format.currentText() or '').lower() if hasattr(self, 'ins_format') else ''
@@ -1248,16 +1869,14 @@ class MainWindow(QMainWindow):
         wv = getattr(self, 'ins_width', None).value() if hasattr(self, 'ins_width') else 0
         hv = getattr(self, 'ins_height', None).value() if hasattr(self, 'ins_height') else 0
         keep_aspect = bool(getattr(self, 'btn_lock', None).isChecked()) if hasattr(self, 'btn_lock') else True
-        for i, job in enumerate(self.jobs):
+        # 轻量覆盖副本只创建一次，逐行重设属性：仅覆盖导出参数，不修改原job，避免提前写入
+        ov = SimpleNamespace()
+        texts: List[str] = []
+        for i in rows:
+            job = self.jobs[i]
             try:
-                it = self.queue.topLevelItem(i)
-                if not it:
-                    continue
-                # 构造一个轻量覆盖副本，仅覆盖导出参数，不修改原job，避免提前写入
-                class OV: pass
                 o = job
                 if job.status in (JobStatus.WAITING, JobStatus.PAUSED) and fmt:
-                    ov = OV()
                     ov.src_bytes = job.src_bytes
                     ov.tiff_compression = getattr(job, 'tiff_compression', 'tiff_deflate')
                     ov.req_size = (int(wv or 0), int(hv or 0))
@@ -1277,27 +1896,21 @@ class MainWindow(QMainWindow):
                         ov.export_format = fmt
                         ov.quality = int(other_q or job.quality)
                     o = ov
-                it.setText(4, self._estimate_output_text(o))
+                texts.append(self._estimate_output_text(o))
             except Exception:
-                pass
+                texts.append("-")
+        self.queue_model.set_estimates(rows, texts)
 
     def _refresh_estimates_throttled(self) -> None:
-        # 简单节流，避免频繁刷新引起卡顿
-        try:
-            from PySide6.QtCore import QTimer
-            if getattr(self, '_est_timer', None) is None:
-                self._est_timer = QTimer(self)
-                self._est_timer.setSingleShot(True)
-                self._est_timer.timeout.connect(self._refresh_estimates)
-            self._est_timer.start(120)
-        except Exception:
-            self._refresh_estimates()
+        # 节流：定时器已在计时则直接返回，拖动滑块时不反复重启定时器
+        if not self._est_timer.isActive():
+            self._est_timer.start()
 
     # ---------- 时间预估 ----------
     def _estimate_total_time_seconds(self) -> float:
-        # 仅对等待/暂停的任务估算
-        jobs = [j for j in self.jobs if j.status in (JobStatus.WAITING, JobStatus.PAUSED)]
-        if not jobs:
+        # 仅对等待/暂停的任务估算（直接取增量维护的行号集合，不遍历全部任务）
+        rows = self._waiting
+        if not rows:
             return 0.0
         # 线程与性能估计
         try:
@@ -1310,27 +1923,18 @@ class MainWindow(QMainWindow):
         # 基础吞吐 MB/s per core
         base_mb_s_per_core = 8.0
         total_work = 0.0  # MB 等效工作量
-        for j in jobs:
+        jobs = self.jobs
+        for i in rows:
+            j = jobs[i]
             mb = max(0.1, j.src_bytes / (1024.0*1024.0))
-            fmt = (j.export_format or '').lower()
-            factor = 1.0
             try:
-                if fmt in ('jpg','jpeg'):
-                    q = max(1, min(100, j.quality))
-                    factor = 0.8 + 1.0*(q/100.0)
-                elif fmt == 'png':
-                    lvl = int(getattr(j, 'png_compress_level', 6))
-                    factor = 1.6 - 0.08*lvl
-                elif fmt == 'webp':
-                    q = max(1, min(100, j.quality))
-                    factor = 0.7 + 1.1*(q/100.0)
-                elif fmt in ('tif','tiff'):
-                    factor = 1.3
+                factor = _work_factor((j.export_format or '').lower(), int(j.quality),
+                                      int(getattr(j, 'png_compress_level', 6)))
             except Exception:
                 factor = 1.0
-            total_work += mb * max(0.3, factor)
+            total_work += mb * factor
         throughput = base_mb_s_per_core * eff_threads
-        seconds = total_work / throughput + 0.2*len(jobs)/eff_threads
+        seconds = total_work / throughput + 0.2*len(rows)/eff_threads
         return max(0.0, seconds)
 
     def _format_seconds(self, s: float) -> str:
@@ -1351,15 +1955,9 @@ class MainWindow(QMainWindow):
             pass
 
     def _refresh_time_estimate_throttled(self) -> None:
-        try:
-            from PySide6.QtCore import QTimer
-            if getattr(self, '_time_timer', None) is None:
-                self._time_timer = QTimer(self)
-                self._time_timer.setSingleShot(True)
-                self._time_timer.timeout.connect(self._refresh_time_estimate)
-            self._time_timer.start(150)
-        except Exception:
-            self._refresh_time_estimate()
+        if not self._time_est_timer.isActive():
+            self._time_est_timer.start()
+
     def _refresh_inspector_preview(self) -> None:
         if not self._selected_indices:
             self.ins_preview.setText("(未选择项目)")
@@ -1416,72 +2014,204 @@ class MainWindow(QMainWindow):
             self._param_title.setText('参数')
 
     # ---------- 任务回调、状态更新 ----------
-    def _on_job_update(self, job_index: int, job: JobItem) -> None:
+    def _on_job_update(self, job_index: int, job: JobItem, emit: bool = True) -> bool:
+        """写入一行任务状态；返回状态是否变化。
+
+        emit 为假时行通知与总进度刷新均由调用方在批量结束后合并执行一次。
+        """
         # 保证UI线程安全：Qt回调已在UI线程执行
-        it = self.queue.topLevelItem(job_index)
-        if not it:
-            return
-        it.setText(2, job.size_text())
-        # 大小与预估更新
+        if not (0 <= job_index < self.queue_model.rowCount()):
+            return False
+        # 状态着色由模型按状态提供（ForegroundRole）
         try:
-            it.setText(3, self._human_bytes(job.src_bytes))
-            it.setText(4, self._estimate_output_text(job))
+            est_txt = self._estimate_output_text(job)
         except Exception:
-            pass
-        # 状态着色徽标化
-        txt = job.status_text()
-        it.setText(5, txt)
-        from PySide6.QtGui import QBrush, QColor
-        color_map = {
-            JobStatus.WAITING: QColor('#6B7280'),
-            JobStatus.RUNNING: QColor('#2563EB'),
-            JobStatus.PAUSED: QColor('#F59E0B'),
-            JobStatus.COMPLETED: QColor('#16A34A'),
-            JobStatus.FAILED: QColor('#DC2626'),
-            JobStatus.CANCELLED: QColor('#9CA3AF'),
-        }
-        it.setForeground(5, QBrush(color_map.get(job.status, QColor('#374151'))))
-        it.setText(6, f"{job.progress}%")
-        it.setText(7, job.error or "")
+            est_txt = "-"
+        self.queue_model.set_job(job_index, job, job.size_text(), est_txt, emit)
+        status = job.status
+        changed = self._track_status(job_index, status)
+        if changed and emit:
+            self._update_total_progress()
+        if status not in (JobStatus.COMPLETED, JobStatus.FAILED):
+            return changed
+        base = os.path.basename(job.src_path)
         # 写入日志
-        if getattr(self.settings, 'export_convert_log', False) and job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+        if getattr(self.settings, 'export_convert_log', False):
+            self._write_convert_log(f"[{datetime.now().isoformat(timespec='seconds')}] {job.status_text()} — {base} {job.error or ''}\n")
+        # 出错弹出通知（后台可见）
+        if status == JobStatus.FAILED and job.error:
+            self._notify("转换失败", f"{base}: {job.error}", error=True)
+        return changed
+
+    def _write_convert_log(self, line: str) -> None:
+        """追加一行到 cconvert.log；句柄按输出目录复用，避免每个任务重复打开文件。"""
+        path = os.path.join(self.output_dir, 'cconvert.log')
+        try:
+            if self._log_fh is None or self._log_path != path:
+                self._close_convert_log()
+                self._log_fh = open(path, 'a', encoding='utf-8')
+                self._log_path = path
+            self._log_fh.write(line)
+            self._log_fh.flush()
+        except Exception:
+            self._close_convert_log()
+
+    def _close_convert_log(self) -> None:
+        fh, self._log_fh = self._log_fh, None
+        if fh is not None:
             try:
-                from datetime import datetime
-                with open(os.path.join(self.output_dir,'cconvert.log'),'a',encoding='utf-8') as f:
-                    f.write(f"[{datetime.now().isoformat(timespec='seconds')}] {job.status_text()} — {os.path.basename(job.src_path)} {job.error or ''}\n")
+                fh.close()
             except Exception:
                 pass
-        # 出错弹出通知（后台可见）
-        if job.status == JobStatus.FAILED and job.error:
-            base = os.path.basename(job.src_path)
-            self._show_notification("转换失败", f"{base}: {job.error}", error=True)
+
+    def _enqueue_job_update(self, payload: dict) -> None:
+        """工作线程回调：所有更新（含终态）写入待刷新表并按需唤醒UI，由定时器合并刷新。"""
+        idx = int(payload.get('index', -1))
+        job = payload.get('job')
+        if job is None or idx < 0:
+            return
+        terminal = job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+        state = (job.status, job.progress)
+        with self._pending_lock:
+            # 状态与百分比均未变化的进度回调不触发重绘（终态总是处理，以便写日志与通知）
+            if not terminal and self._last_job_state.get(idx) == state:
+                return
+            self._last_job_state[idx] = state
+            wake = not self._pending_job_updates
+            self._pending_job_updates[idx] = job
+        if wake:
+            self.bus.job_updates_pending.emit()
+
+    def _schedule_job_flush(self) -> None:
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_job_updates(self) -> None:
+        """一次性刷新本帧内累积的任务更新。"""
+        with self._pending_lock:
+            pending, self._pending_job_updates = self._pending_job_updates, {}
+        if not pending:
+            return
+        # 逐行只写模型数据，最后对涉及的行区间发出一次 dataChanged
+        lo, hi = len(self.jobs), -1
+        changed = False
+        for idx, job in pending.items():
+            # 队列已清空或重建时丢弃过期更新
+            if idx < len(self.jobs) and self.jobs[idx] is job:
+                changed |= self._on_job_update(idx, job, emit=False)
+                lo, hi = min(lo, idx), max(hi, idx)
+        self.queue_model.emit_rows(lo, hi, 2, 7)
+        if changed:
+            self._update_total_progress()
+
+    def _track_status(self, idx: int, status: JobStatus) -> bool:
+        """记录行状态变化并增量更新计数；状态有变化时返回True。"""
+        if not (0 <= idx < len(self._job_status)):
+            return False
+        old = self._job_status[idx]
+        if old == status:
+            return False
+        self._status_counts[old] -= 1
+        self._status_counts[status] += 1
+        self._job_status[idx] = status
+        if status in (JobStatus.WAITING, JobStatus.PAUSED):
+            self._waiting.add(idx)
+        else:
+            self._waiting.discard(idx)
+        return True
+
+    def _on_meta_ready(self, batch: list) -> None:
+        """回填后台读取的文件大小与像素尺寸，只更新尺寸/大小/预估三列。"""
+        lo, hi = len(self.jobs), -1
+        stale = False
+        for idx, job, size_b, mtime, dims in batch:
+            if idx >= len(self.jobs) or self.jobs[idx] is not job:
+                continue
+            path = job.src_path
+            self._src_mtime[path] = mtime
+            # 缓存中的缩略图来自修改前的文件：丢弃句柄，可视行随后重新解码
+            entry = self._thumb_handles.get(path)
+            if entry is not None:
+                if not entry[1]:
+                    # 元数据到达前解码的缩略图：补记修改时间
+                    self._thumb_handles[path] = (entry[0], mtime, entry[2])
+                elif entry[1] != mtime:
+                    QPixmapCache.remove(self._thumb_handles.pop(path)[2])
+                    stale = True
+            job.src_bytes = size_b
+            if dims is not None and not any(job.orig_size):
+                job.orig_size = dims
+            self.queue_model.set_meta(idx, job.size_text(), self._human_bytes(size_b), self._estimate_output_text(job), emit=False)
+            lo, hi = min(lo, idx), max(hi, idx)
+        self.queue_model.emit_rows(lo, hi, 2, 4)
+        if stale:
+            self._thumb_vis_timer.start(0)
+        self._refresh_time_estimate_throttled()
 
     def _on_overall_update(self, total_progress: int, remaining: int) -> None:
-        # 由UI侧统一统计总进度，忽略传入值
-        self._update_total_progress()
+        # 总进度随 _on_job_update 中的状态变化增量刷新，此处无需重复统计
+        pass
 
-    def _on_thumb_ready(self, idx: int, src_path: str, img: QImage) -> None:
+    def _on_thumb_ready(self, idx: int, src_path: str, img: QImage, side: int, dims) -> None:
         # 验证索引与路径，避免因队列变化导致错配
         if idx < 0 or idx >= len(self.jobs):
             return
         if self.jobs[idx].src_path != src_path:
             return
-        it = self.queue.topLevelItem(idx)
-        if not it:
-            return
-        # 缓存并按当前列宽等比缩放设置到行标签
-        self._thumb_cache[idx] = img
         try:
             self._thumb_loading.discard(idx)
         except Exception:
             pass
-        w = self._thumb_target_width()
-        h = max(32, int(round(w * (img.height() / max(1.0, float(img.width()))))))
-        pix = QPixmap.fromImage(img.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        lbl = self._thumb_labels.get(idx)
-        if lbl is not None:
-            lbl.setPixmap(pix)
-        it.setSizeHint(0, QSize(w, h))
+        # 解码时顺带读到的原图尺寸先行回填（后台元数据读取随后跳过该文件的头部解析）
+        job = self.jobs[idx]
+        if dims:
+            if not any(job.orig_size):
+                job.orig_size = dims
+            self.queue_model.set_dims(idx, job.size_text())
+        # 重复请求的结果（行已显示同档位、同版本的缩略图）：无需再转换像素图与替换缓存
+        entry = self._thumb_handles.get(src_path)
+        if (entry is not None and entry[0] == side and entry[1] == self._src_mtime.get(src_path, 0)
+                and self.queue_model.has_thumb(idx)):
+            return
+        # 在UI线程一次性转换为QPixmap并放入缓存，再按当前列宽设置到行。
+        # 缓存按实际解码档位登记：解码期间列宽跨档时，结果先行显示，可视行随后按新档位重新请求
+        pm = QPixmap.fromImage(img)
+        self._store_thumb(src_path, pm, side)
+        self._apply_thumb(idx, pm)
+
+    def _apply_thumb(self, idx: int, pm: QPixmap) -> None:
+        """将缩略图设为行图标（在方形 iconSize 内等比绘制，行高保持统一）。
+
+        iconSize 已在添加任务与列宽变化时同步，此处无需逐张读取列宽。
+        """
+        if not (0 <= idx < self.queue_model.rowCount()):
+            return
+        self.queue_model.set_thumb(idx, QIcon(pm))
+
+    def _store_thumb(self, path: str, pm: QPixmap, side: int) -> None:
+        """放入缓存并记录句柄；替换同一路径的旧句柄（如列宽跨档后重新解码），超出上限时淘汰最久未用的。"""
+        handles = self._thumb_handles
+        old = handles.pop(path, None)
+        if old is not None:
+            QPixmapCache.remove(old[2])
+        handles[path] = (side, self._src_mtime.get(path, 0), QPixmapCache.insert(pm))
+        while len(handles) > self._thumb_handles_max:
+            QPixmapCache.remove(handles.popitem(last=False)[1][2])
+
+    def _thumb_decode_side(self) -> int:
+        """缩略图解码边长：列宽的2倍（保证清晰，最大512），向上取到 images 中定义的解码档位。"""
+        return snap_thumb_side(min(512, self._thumb_target_width() * 2))
+
+    def _cached_thumb(self, index: int) -> Optional[QPixmap]:
+        """返回指定行已缓存的缩略图；未缓存、档位不符或已被淘汰时返回None。"""
+        if not (0 <= index < len(self.jobs)):
+            return None
+        path = self.jobs[index].src_path
+        entry = self._thumb_handles.get(path)
+        if entry is None or entry[0] != self._thumb_decode_side():
+            return None
+        self._thumb_handles.move_to_end(path)
+        return QPixmapCache.find(entry[2])
 
 
     # ---------- 缩略图列联动 ----------
@@ -1494,82 +2224,108 @@ class MainWindow(QMainWindow):
         return max(40, min(220, int(w - 6)))
 
     def _request_thumb_for(self, index: int) -> None:
-        """确保提交指定行的缩略图加载任务（若未缓存且未在加载）。"""
+        """确保提交指定行的缩略图加载任务（若未缓存且未在加载）。缓存命中时直接设置到行。"""
         try:
-            if index in self._thumb_cache:
-                return
             if index in self._thumb_loading:
                 return
             if not (0 <= index < len(self.jobs)):
                 return
             job = self.jobs[index]
             src = job.src_path
+            cached = self._cached_thumb(index)
+            if cached is not None:
+                self._apply_thumb(index, cached)
+                return
             self._thumb_loading.add(index)
-            # 预估缩略图目标尺寸（放大2倍，保证清晰；上限512）
-            req_side = min(512, max(64, self._thumb_target_width() * 2))
+            req_side = self._thumb_decode_side()
 
             def _load_and_emit(idx=index, s=src, side=req_side, j=job):
-                img: QImage | None = load_thumbnail(s, side)
-                if img is not None:
-                    self.bus.thumb_ready.emit(idx, s, img)
-                # 尺寸异步补充
-                sz = get_image_size(s)
-                if sz is not None:
-                    j.orig_size = sz
+                try:
+                    # 解码前后检查线程池暂停标志，关闭时尽快返回
+                    if self._thumb_pool.paused:
+                        return
+                    img, dims = load_thumbnail_and_size(s, side)
+                    if self._thumb_pool.paused:
+                        return
+                    # 解码顺带读到的尺寸立即写回任务：后台元数据读取若尚未处理到该文件，
+                    # 即可跳过再次打开文件解析头部（不必等UI线程回填）
+                    if dims and not any(j.orig_size):
+                        j.orig_size = dims
+                    if img is not None:
+                        # 在工作线程转换为像素图的原生格式，UI线程 QPixmap.fromImage 只需共享数据、不再逐像素转换
+                        img = img.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied if img.hasAlphaChannel()
+                                                  else QImage.Format.Format_RGB32)
+                        self.bus.thumb_ready.emit(idx, s, img, side, dims)
+                finally:
+                    # 标记结束（无论成功失败）
                     try:
-                        self.bus.job_update.emit(idx, j)
+                        self._thumb_loading.discard(idx)
                     except Exception:
                         pass
-                # 标记结束（无论成功失败）
-                try:
-                    self._thumb_loading.discard(idx)
-                except Exception:
-                    pass
 
             self._thumb_pool.submit(_load_and_emit)
         except Exception:
             pass
 
+    def _cancel_thumb_jobs(self) -> None:
+        """关闭前暂停缩略图池：排队任务取消，执行中的任务在当前步骤后退出。"""
+        self._thumb_pool.shutdown()
+
+    def _schedule_visible_thumbs(self, *_args) -> None:
+        """节流：50ms 内的连续滚动/缩放只触发一次可视行检查（已在计时则不重启，持续滚动时也按节拍加载）。"""
+        if not self._thumb_vis_timer.isActive():
+            self._thumb_vis_timer.start(50)
+
     def _ensure_visible_thumbs(self) -> None:
-        """在滚动/重绘时，确保视口内行的缩略图都已请求加载。"""
+        """确保视口内行的缩略图都已请求加载；仅处理可视行带中未缓存且未在加载的行。"""
         try:
-            vp = self.queue.viewport()
-            h = vp.height()
-            # 以较大步长向下取样行，避免过多计算
-            y = 0
-            seen = set()
-            while y < h:
-                it = self.queue.itemAt(10, y)  # 取第1列区域的一个点
-                if it is not None:
-                    idx = it.data(0, Qt.UserRole)
-                    if idx is not None and idx not in seen:
-                        seen.add(idx)
-                        self._request_thumb_for(int(idx))
-                y += 48
+            proxy = self.queue_proxy
+            cnt = proxy.rowCount()
+            if cnt == 0:
+                return
+            top = self.queue.indexAt(QPoint(0, 0))
+            bot = self.queue.indexAt(self.queue.viewport().rect().bottomLeft())
+            r0 = top.row() if top.isValid() else 0
+            r1 = bot.row() if bot.isValid() else cnt - 1
+
+            def src_row(r: int) -> int:
+                return proxy.mapToSource(proxy.index(r, 0)).row()
+
+            # 视图行号经代理映射为任务下标；多取一行，滚动时下一行提前就绪
+            need = {src_row(r) for r in range(r0, min(cnt, r1 + 2))} - self._thumb_loading
+            model = self.queue_model
+            for idx in sorted(need):
+                if model.has_thumb(idx) and self._cached_thumb(idx) is not None:
+                    continue
+                # 缓存命中时直接回填到行，否则提交后台解码
+                self._request_thumb_for(idx)
+            span = r1 - r0 + 1
+            # 预读下一屏的源文件（每行只预读一次），滚动到达时解码无需再等磁盘
+            ahead = [src_row(r) for r in range(min(cnt, r1 + 2), min(cnt, r1 + 2 + span))]
+            ahead = [i for i in ahead if i not in self._prefetched and not model.has_thumb(i)]
+            if ahead:
+                self._prefetched.update(ahead)
+                paths = [self.jobs[i].src_path for i in ahead]
+                cancel = self._scan_cancel
+                QThreadPool.globalInstance().start(lambda: _prefetch_files(paths, cancel))
+            # 视口上下各两屏之外的行释放缩略图，行图标占用的内存与队列长度无关
+            lo = src_row(max(0, r0 - 2 * span))
+            hi = src_row(min(cnt - 1, r1 + 2 * span))
+            model.release_thumbs(lo, hi)
         except Exception:
             pass
 
     def _update_all_row_heights(self) -> None:
+        """列宽变化后更新图标尺寸与行高；图标由视图绘制时缩放，无需重新生成像素图。"""
         w = self._thumb_target_width()
-        cnt = self.queue.topLevelItemCount()
-        for i in range(cnt):
-            it = self.queue.topLevelItem(i)
-            img = self._thumb_cache.get(i)
-            if img is None:
-                h = w
-                pix = self._placeholder_pixmap(w, w)
-            else:
-                h = max(32, int(round(w * (img.height() / max(1.0, float(img.width()))))))
-                pix = QPixmap.fromImage(img.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            it.setSizeHint(0, QSize(w, h))
-            lbl = self._thumb_labels.get(i)
-            if lbl is None:
-                self._attach_thumb_widget(it, i)
-                lbl = self._thumb_labels.get(i)
-            if lbl is not None:
-                lbl.setPixmap(pix)
+        self._sync_icon_size(w)
+        # 已有真实缩略图的行在列宽跨档重新解码前继续沿用旧图
+        if not self.queue_model.relayout_thumbs(w, self._placeholder_icon(w)):
+            return
         try:
             self.queue.viewport().update()
+            # 列宽跨越解码档位时，可视行需按新档位重新请求缩略图
+            self._schedule_visible_thumbs()
         except Exception:
             pass
 
@@ -1584,31 +2340,18 @@ class MainWindow(QMainWindow):
                 hdr.resizeSection(0, target)
             finally:
                 hdr.blockSignals(False)
-        self._update_all_row_heights()
-        try:
-            self.queue.viewport().update()
-        except Exception:
-            pass
+        self._resize_debounce.start()
 
-    def _placeholder_pixmap(self, w: int, h: int) -> QPixmap:
-        p = QPixmap(max(1, w), max(1, h))
-        p.fill(QColor(230, 230, 230))
-        return p
+    def _sync_icon_size(self, w: int) -> None:
+        """图标绘制尺寸跟随缩略图列宽（仅在变化时设置，避免触发重新布局）。"""
+        if self.queue.iconSize().width() != w:
+            self.queue.setIconSize(QSize(w, w))
 
-    def _attach_thumb_widget(self, it: QTreeWidgetItem, index: int) -> None:
-        """确保给指定行附加缩略图QLabel，放置占位并注册引用。"""
-        from PySide6.QtWidgets import QLabel
-        lbl = QLabel()
-        lbl.setAlignment(Qt.AlignCenter)
-        try:
-            lbl.setScaledContents(True)
-        except Exception:
-            pass
-        w = self._thumb_target_width()
-        lbl.setPixmap(self._placeholder_pixmap(w, w))
-        self.queue.setItemWidget(it, 0, lbl)
-        self._thumb_labels[index] = lbl
-        it.setSizeHint(0, QSize(w, w))
+    def _placeholder_icon(self, w: int) -> QIcon:
+        """所有行共享同一个占位图标（隐式共享），仅在缩略图列宽变化时重新生成。"""
+        if self._placeholder_cache[0] != w:
+            self._placeholder_cache = (w, QIcon(make_placeholder_thumbnail(w)))
+        return self._placeholder_cache[1]
 
     def _update_total_progress(self) -> None:
         total = len(self.jobs)
@@ -1620,23 +2363,25 @@ class MainWindow(QMainWindow):
             # 空列表时显示提示
             self._update_empty_placeholder()
             return
-        done = sum(1 for j in self.jobs if j.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED))
+        counts = self._status_counts
+        succ = counts[JobStatus.COMPLETED]
+        fail = counts[JobStatus.FAILED]
+        canc = counts[JobStatus.CANCELLED]
+        done = succ + fail + canc
         self.total_progress.setValue(int(100 * done / total))
         self._label_remaining.setText(f"剩余：{total - done}")
         if hasattr(self, '_label_done'):
             self._label_done.setText(f"已完成 {done}/{total}")
         # 全部完成时弹出通知（只弹一次）
         if done == total and total > 0 and not self._notified_all_done:
-            succ = sum(1 for j in self.jobs if j.status == JobStatus.COMPLETED)
-            fail = sum(1 for j in self.jobs if j.status == JobStatus.FAILED)
-            canc = sum(1 for j in self.jobs if j.status == JobStatus.CANCELLED)
-            self._show_notification("处理完成", f"共{total}项：成功{succ}，失败{fail}，取消{canc}")
+            self._notify("处理完成", f"共{total}项：成功{succ}，失败{fail}，取消{canc}")
             self._notified_all_done = True
             # 重置开始按钮并释放执行器，允许重新开始
             try:
                 self.task_manager.stop()
             except Exception:
                 pass
+            self._close_convert_log()
             self._start_button_state = "start"
             self._refresh_topbar_states()
 
@@ -1656,24 +2401,35 @@ class MainWindow(QMainWindow):
             self.settings.default_output_dir = newd
             AppSettings.save(self.settings)
             self._apply_output_dir_to_jobs()
-        # 收集冲突列表（仅检测磁盘已存在的文件）
+        # “替换”策略下无论是否冲突都直接开始，无需生成输出路径与扫描目录
+        policy = getattr(self.settings, 'collision_policy', 'ask')
+        if policy == 'replace':
+            return True
+        # 收集冲突列表（仅检测磁盘已存在的文件）：每个输出目录只 scandir 一次，
+        # 之后按文件名做集合查找，避免逐个任务 stat
         conflicts: list[tuple[int, str]] = []  # (job_index, out_path)
+        listings: dict[str, set[str]] = {}
+        norm = os.path.normcase
+        skip = (JobStatus.COMPLETED, JobStatus.RUNNING, JobStatus.CANCELLED)
         for idx, job in enumerate(self.jobs):
-            if job.status in (JobStatus.COMPLETED, JobStatus.RUNNING, JobStatus.CANCELLED):
+            if job.status in skip:
                 continue
             out_path = build_output_path(job, idx + 1)
-            try:
-                if os.path.exists(out_path):
-                    conflicts.append((idx, out_path))
-            except Exception:
-                pass
+            d, name = os.path.split(out_path)
+            names = listings.get(d)
+            if names is None:
+                try:
+                    with os.scandir(d or '.') as it:
+                        names = {norm(e.name) for e in it}
+                except OSError:
+                    names = set()
+                listings[d] = names
+            if norm(name) in names:
+                conflicts.append((idx, out_path))
 
         if not conflicts:
             return True
 
-        policy = getattr(self.settings, 'collision_policy', 'ask')
-        if policy == 'replace':
-            return True
         if policy == 'skip':
             self._apply_skip_for_conflicts(conflicts, reason="同名文件已存在，按设置跳过")
             return True
@@ -1717,14 +2473,18 @@ class MainWindow(QMainWindow):
 
     def _apply_skip_for_conflicts(self, conflicts: list[tuple[int, str]], reason: str) -> None:
         """将冲突条目标记为取消并更新队列显示。"""
+        lo, hi = len(self.jobs), -1
         for idx, _ in conflicts:
             if 0 <= idx < len(self.jobs):
                 job = self.jobs[idx]
                 job.status = JobStatus.CANCELLED
                 job.progress = 100
                 job.error = reason
-                # 更新UI行
-                self._on_job_update(idx, job)
+                # 更新UI行（合并为一次 dataChanged）
+                self._on_job_update(idx, job, emit=False)
+                lo, hi = min(lo, idx), max(hi, idx)
+        self.queue_model.emit_rows(lo, hi, 2, 7)
+        self._update_total_progress()
 
     def _apply_current_settings_to_pending_jobs(self) -> None:
         """将当前检查器设置应用到所有未完成任务，避免用户未点击“应用到选中”。"""
@@ -1786,7 +2546,7 @@ class MainWindow(QMainWindow):
         self.tray.activated.connect(self._on_tray_activated)
         self.tray.show()
         # 初始状态同步
-        self._refresh_topbar_states()
+        self._queue_topbar_refresh()
 
     def _on_tray_activated(self, reason):  # type: ignore
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
@@ -1799,24 +2559,32 @@ class MainWindow(QMainWindow):
     def _tray_exit(self) -> None:
         # 托盘菜单退出：真正退出应用
         self._really_quit = True
+        self._do_graceful_shutdown()
+        QApplication.instance().quit()
+
+    def _do_graceful_shutdown(self) -> None:
+        """退出前统一收尾：写入待保存设置，有界等待转换线程退出，并取消缩略图任务。"""
+        self._flush_settings()
+        self._scan_cancel.set()
         try:
-            self.task_manager.stop()
-        except Exception:
-            pass
-        try:
-            self._thumb_pool.shutdown(wait=False, cancel_futures=True)
-        except Exception:
+            self.task_manager.stop(timeout=2.0)
+        except TimeoutError:
+            # 仍有图片处于不可中断的编码中：不再等待，随进程退出回收
             pass
-        from PySide6.QtWidgets import QApplication
-        QApplication.instance().quit()
+        self._cancel_thumb_jobs()
+        self._close_convert_log()
+
+    def _bind_notify(self) -> None:
+        """按通知开关绑定 self._notify：启用时指向 _show_notification，否则为空操作。"""
+        if getattr(self.settings, 'enable_notifications', True):
+            self._notify = self._show_notification
+        else:
+            self._notify = lambda *a, **k: None
 
     def _show_notification(self, title: str, message: str, error: bool = False) -> None:
         try:
-            # 未启用通知则直接返回
-            if not getattr(self.settings, 'enable_notifications', True):
-                return
             if hasattr(self, 'tray') and self.tray and self.tray.isVisible():
-                icon = QSystemTrayIcon.MessageIcon.Critical if error else QSystemTrayIcon.MessageIcon.Information
+                icon = self._icon_crit if error else self._icon_info
                 # Windows气泡通知自动消失
                 self.tray.showMessage(title, message, icon, 4000)
         except Exception:
@@ -1834,9 +2602,10 @@ class MainWindow(QMainWindow):
             btn_min = msg.addButton("最小化后台运行", QMessageBox.AcceptRole)
             btn_exit = msg.addButton("直接退出", QMessageBox.DestructiveRole)
             msg.setIcon(QMessageBox.Question)
+            # 按钮 -> 行为映射（仅在 ask 时构建一次对话框）
+            role_map = {id(btn_min): 'minimize', id(btn_exit): 'exit'}
             msg.exec()
-            clicked = msg.clickedButton()
-            action = 'minimize' if clicked == btn_min else 'exit'
+            action = role_map.get(id(msg.clickedButton()), 'exit')
             self.settings.on_close_action = action
             AppSettings.save(self.settings)
 
@@ -1844,18 +2613,12 @@ class MainWindow(QMainWindow):
         if not self._really_quit and action == 'minimize' and hasattr(self, 'tray') and self.tray.isVisible():
             event.ignore()
             self.hide()
-            self._show_notification("后台运行", "程序已最小化到托盘，继续在后台处理。")
+            # 托盘气泡可能阻塞（Windows外壳调用），延后到事件循环空闲时发送
+            QTimer.singleShot(0, lambda: self._notify("后台运行", "程序已最小化到托盘，继续在后台处理。"))
             return
 
         # 否则直接退出
-        try:
-            self.task_manager.stop()
-        except Exception:
-            pass
-        try:
-            self._thumb_pool.shutdown(wait=False, cancel_futures=True)
-        except Exception:
-            pass
+        self._do_graceful_shutdown()
         super().closeEvent(event)
 
     # ---------- 应用设置与目录校验 ----------
@@ -1864,7 +2627,11 @@ class MainWindow(QMainWindow):
         dlg = AppSettingsDialog(self.settings, self)
         if dlg.exec() == QDialog.Accepted:
             enable, action, dup, cols, py, export_log = dlg.values()
+            before = self.settings.snapshot()
+            # 记录影响列表显示的设置，仅在实际变化时才重算列与预估
+            prev = (self.settings.show_col_dims, self.settings.show_col_size, self.settings.show_col_estimate, self.settings.collision_policy)
             self.settings.enable_notifications = enable
+            self._bind_notify()
             self.settings.on_close_action = action
             self.settings.collision_policy = dup
             # 列显示设置
@@ -1874,9 +2641,12 @@ class MainWindow(QMainWindow):
             # Python 解释器路径
             self.settings.selected_python_path = py or self.settings.selected_python_path
             self.settings.export_convert_log = bool(export_log)
-            AppSettings.save(self.settings)
-            self._apply_column_visibility()
-            self._refresh_estimates_throttled()
+            if self.settings.snapshot() != before:
+                AppSettings.save(self.settings)
+            curr = (self.settings.show_col_dims, self.settings.show_col_size, self.settings.show_col_estimate, self.settings.collision_policy)
+            if curr != prev:
+                self._apply_column_visibility()
+                self._refresh_estimates_throttled()
 
     def _open_format_settings_dialog(self) -> None:
         """打开‘更多设置’对话框，依当前格式显示高级参数。"""
@@ -1889,31 +2659,49 @@ class MainWindow(QMainWindow):
             self._refresh_time_estimate_throttled()
 
     def _update_thread_controls(self) -> None:
-        """根据Auto/手动选择启用/禁用线程数控件。"""
-        auto = hasattr(self, 'rb_auto') and self.rb_auto.isChecked()
-        en = not auto
-        self.ins_threads.setEnabled(en)
-        if hasattr(self, 'btn_thr_minus'):
-            self.btn_thr_minus.setEnabled(en)
-        if hasattr(self, 'btn_thr_plus'):
-            self.btn_thr_plus.setEnabled(en)
-        if hasattr(self, 'rb_auto'):
+        """根据Auto/手动选择启用/禁用线程数控件（状态未变化时不重复写入）。"""
+        if self._last_auto_threads != self._auto_threads:
             self.rb_auto.setText(f"Auto（当前={self._auto_threads} 线程）")
+            self._last_auto_threads = self._auto_threads
+        en = not self.rb_auto.isChecked()
+        if en == self._last_thread_en:
+            return
+        self._last_thread_en = en
+        for w in self._thread_widgets:
+            w.setEnabled(en)
+
+    def _mark_settings_dirty(self) -> None:
+        """标记设置待保存，由去抖定时器（或退出时）统一写盘。"""
+        self._settings_dirty = True
+        self._settings_save_timer.start()
+
+    def _flush_settings(self) -> None:
+        """若有未保存的设置则立即写盘。"""
+        self._settings_save_timer.stop()
+        if self._settings_dirty:
+            self._settings_dirty = False
+            AppSettings.save(self.settings)
 
     def _ensure_valid_output_dir(self) -> None:
         """保留占位以兼容旧调用（已不在启动时强制创建）。"""
         return
 
     def _ensure_valid_input_dir(self) -> str:
-        """返回用于文件/文件夹选择对话框的起始目录，若上次目录不存在则提示并让用户选择。"""
-        d = self.settings.last_input_dir or os.getcwd()
-        if not os.path.isdir(d):
-            self._show_info("之前的输入目录不存在，请选择新的输入目录。","输入目录")
-            nd = QFileDialog.getExistingDirectory(self, "选择输入目录", os.getcwd())
+        """返回用于文件/文件夹选择对话框的起始目录，若上次目录不存在则提示并让用户选择。
+
+        短时间内重复打开时复用目录存在性检查结果（2秒内），避免在网络盘上反复stat。
+        """
+        d = self.settings.last_input_dir or self._cwd_cached
+        if not _isdir_cached(d):
+            # 非模态提示：状态栏消息 + 对话框标题，避免连续两个模态窗口
+            self.statusBar().showMessage("上次输入目录不存在，请重新选择", 5000)
+            nd = QFileDialog.getExistingDirectory(self, "选择输入目录（上次目录不存在）", self._cwd_cached)
             if nd:
                 self.settings.last_input_dir = nd
-                AppSettings.save(self.settings)
+                self._mark_settings_dirty()
                 d = nd
             else:
-                d = os.getcwd()
+                # 取消选择：丢弃旧结果，下次重新检查（目录可能已重新挂载）
+                _invalidate_dir_cache(d)
+                d = self._cwd_cached
         return d
@@ -5,11 +5,14 @@ Conda 环境发现与依赖检测。
 
 from __future__ import annotations
 
+import glob
 import json
 import os
+import shutil
 import subprocess
+import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import sys
 
 
@@ -33,8 +36,74 @@ def _run(cmd: List[str]) -> Tuple[int, str, str]:
     return p.returncode, out, err
 
 
+# find_conda_envs 结果缓存：(time.monotonic() 时间戳, 环境列表)
+_ENVS_CACHE: Optional[Tuple[float, List[CondaEnv]]] = None
+_ENVS_TTL = 60.0
+
+
+def _read_envs_txt() -> List[str]:
+    """读取 conda 维护的 ~/.conda/environments.txt（每行一个环境前缀）。"""
+    try:
+        with open(os.path.expanduser('~/.conda/environments.txt'), encoding='utf-8') as f:
+            return [line.strip() for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+def _scan_conda_envs() -> List[CondaEnv]:
+    """直接扫描文件系统发现环境，不启动 conda 子进程。
+
+    来源：environments.txt、CONDA_ENVS_PATH，以及各 base 安装目录下的 envs/*。
+    """
+    prefixes: List[str] = _read_envs_txt()
+    bases: List[str] = []
+    conda_exe = os.environ.get('CONDA_EXE')
+    if conda_exe:
+        # <base>/bin/conda 或 <base>\Scripts\conda.exe
+        bases.append(os.path.dirname(os.path.dirname(conda_exe)))
+    for p in prefixes + [os.environ.get('CONDA_PREFIX', '')]:
+        if not p:
+            continue
+        parent = os.path.dirname(p)
+        bases.append(os.path.dirname(parent) if os.path.basename(parent) == 'envs' else p)
+    env_dirs = [os.path.join(b, 'envs') for b in bases]
+    env_dirs += [d for d in os.environ.get('CONDA_ENVS_PATH', '').split(os.pathsep) if d]
+    for b in bases:
+        if b not in prefixes:
+            prefixes.append(b)
+    for d in env_dirs:
+        for p in sorted(glob.glob(os.path.join(d, '*'))):
+            if p not in prefixes:
+                prefixes.append(p)
+    envs: List[CondaEnv] = []
+    seen = set()
+    for p in prefixes:
+        key = os.path.normcase(os.path.abspath(p))
+        if key in seen:
+            continue
+        seen.add(key)
+        env = CondaEnv(name=os.path.basename(p), prefix=p)
+        if os.path.isfile(env.python):
+            envs.append(env)
+    return envs
+
+
 def find_conda_envs() -> List[CondaEnv]:
-    """发现所有Conda环境。"""
+    """发现所有Conda环境。
+
+    优先扫描文件系统（毫秒级），都找不到时才回退到 conda 子进程；结果缓存60秒。
+    """
+    global _ENVS_CACHE
+    now = time.monotonic()
+    if _ENVS_CACHE is not None and now - _ENVS_CACHE[0] < _ENVS_TTL:
+        return list(_ENVS_CACHE[1])
+    envs = _scan_conda_envs() or _find_conda_envs_subprocess()
+    _ENVS_CACHE = (now, envs)
+    return list(envs)
+
+
+def _find_conda_envs_subprocess() -> List[CondaEnv]:
+    """通过 conda 命令枚举环境（较慢：需冷启动 conda）。"""
     # 优先用JSON
     code, out, err = _run(['conda', 'env', 'list', '--json'])
     envs: List[CondaEnv] = []
@@ -61,43 +130,150 @@ def find_conda_envs() -> List[CondaEnv]:
     return envs
 
 
+# 依赖检测通过的结果缓存：(解释器路径, 修改时间) -> 结果；解释器被替换/升级后自动失效。
+# 未通过的结果不缓存，用户在该环境补装依赖后再次检测即可生效
+_DEP_CACHE: dict[tuple[str, float], Tuple[bool, str]] = {}
+# 系统解释器枚举缓存：(sys.executable, PATH) -> (time.monotonic() 时间戳, 路径列表)；
+# 与 _ENVS_CACHE 相同按60秒过期，运行期间新装的解释器（含注册表项）随后即可发现
+_PY_CACHE: dict[tuple[str, str], Tuple[float, List[str]]] = {}
+_PY_TTL = 60.0
+
+
 def test_env_dependencies(env: CondaEnv) -> Tuple[bool, str]:
-    """检测指定环境是否具备必要依赖。"""
-    if not os.path.isfile(env.python):
+    """检测指定环境是否具备必要依赖（按解释器修改时间缓存结果）。"""
+    try:
+        key = (env.python, os.path.getmtime(env.python))
+    except OSError:
         return False, f"未找到Python: {env.python}"
+    hit = _DEP_CACHE.get(key)
+    if hit is not None:
+        return hit
     code, out, err = _run([env.python, '-c', 'import PIL, pillow_heif; print("OK")'])
     if code == 0 and 'OK' in out:
-        return True, "依赖就绪"
+        _DEP_CACHE[key] = (True, "依赖就绪")
+        return _DEP_CACHE[key]
     return False, err or out or "依赖不满足"
 
 
+def _reg_subkeys(winreg, key) -> List[str]:
+    names: List[str] = []
+    i = 0
+    while True:
+        try:
+            names.append(winreg.EnumKey(key, i))
+        except OSError:
+            return names
+        i += 1
+
+
+def _registry_pythons() -> List[str]:
+    """Windows：按 PEP 514 从注册表读取已安装解释器，无需启动 `py -0p`。
+
+    枚举 Software\\Python 下除 PyLauncher 外的所有发行方（PythonCore、应用商店版等），
+    HKLM 同时读取 64 位与 32 位视图，与 py 启动器的查找范围一致。
+    """
+    try:
+        import winreg  # type: ignore
+    except Exception:
+        return []
+    found: List[str] = []
+    views = (
+        (winreg.HKEY_CURRENT_USER, 0),
+        (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_64KEY),
+        (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_32KEY),
+    )
+    for hive, view in views:
+        access = winreg.KEY_READ | view  # 子键也需带上视图标志
+        try:
+            root = winreg.OpenKey(hive, r'Software\Python', 0, access)
+        except OSError:
+            continue
+        with root:
+            for company in _reg_subkeys(winreg, root):
+                if company == 'PyLauncher':
+                    continue
+                try:
+                    ck = winreg.OpenKey(root, company, 0, access)
+                except OSError:
+                    continue
+                with ck:
+                    for tag in _reg_subkeys(winreg, ck):
+                        try:
+                            with winreg.OpenKey(ck, tag + r'\InstallPath', 0, access) as k:
+                                try:
+                                    exe = winreg.QueryValueEx(k, 'ExecutablePath')[0]
+                                except OSError:
+                                    exe = os.path.join(winreg.QueryValueEx(k, '')[0], 'python.exe')
+                        except OSError:
+                            continue
+                        if exe and os.path.isfile(exe):
+                            found.append(exe)
+    return found
+
+
+def _py_launcher_pythons() -> List[str]:
+    """Windows：通过 `py -0p` 枚举已注册的解释器（注册表无结果时的回退）。"""
+    found: List[str] = []
+    try:
+        code, out, err = _run(['py', '-0p'])
+        if code == 0:
+            for line in out.splitlines():
+                p = line.strip()
+                if p and os.path.isfile(p) and p.lower().endswith('python.exe'):
+                    found.append(p)
+    except Exception:
+        pass
+    return found
+
+
+def _path_pythons() -> List[str]:
+    """非Windows：PATH 中的 python3/python 及常见前缀下的 python3.X，仅做文件系统查找。"""
+    found: List[str] = []
+    for name in ('python3', 'python'):
+        p = shutil.which(name)
+        if p:
+            found.append(p)
+    for d in ('/usr/bin', '/usr/local/bin', '/opt/homebrew/bin'):
+        for p in sorted(glob.glob(os.path.join(d, 'python3.*'))):
+            # 排除 python3.X-config 等非解释器
+            if os.path.basename(p)[len('python3.'):].isdigit() and os.access(p, os.X_OK):
+                found.append(p)
+    return found
+
+
 def find_system_pythons() -> List[str]:
     """发现系统中的 Python 解释器路径列表。
 
     - 永远包含当前进程的 `sys.executable`
-    - Windows 上尝试通过 `py -0p` 枚举已注册的解释器
-    - 其他平台可扩展 PATH 搜索，这里保守返回当前解释器
+    - Windows 上读取注册表（PEP 514 各发行方），无结果时回退到 `py -0p`
+    - 其他平台查找 PATH 与常见安装前缀，不启动子进程
+    - 指向同一文件的路径（符号链接）只保留第一个
+
+    结果按 (sys.executable, PATH) 缓存60秒，短时间内重复打开设置时不再重新查找。
     """
+    key = (sys.executable, os.environ.get('PATH', ''))
+    now = time.monotonic()
+    hit = _PY_CACHE.get(key)
+    if hit is not None and now - hit[0] < _PY_TTL:
+        return list(hit[1])
     paths: List[str] = []
     try:
         paths.append(sys.executable)
     except Exception:
         pass
-    # Windows 的 py 启动器
     if os.name == 'nt':
-        try:
-            code, out, err = _run(['py', '-0p'])
-            if code == 0:
-                for line in out.splitlines():
-                    p = line.strip()
-                    if p and os.path.isfile(p) and p.lower().endswith('python.exe'):
-                        if p not in paths:
-                            paths.append(p)
-        except Exception:
-            pass
-    # 去重
-    uniq = []
+        paths.extend(_registry_pythons() or _py_launcher_pythons())
+    else:
+        paths.extend(_path_pythons())
+    # 去重（按真实路径）
+    uniq: List[str] = []
+    seen = set()
     for p in paths:
-        if p and p not in uniq:
+        if not p:
+            continue
+        real = os.path.normcase(os.path.realpath(p))
+        if real not in seen:
+            seen.add(real)
             uniq.append(p)
-    return uniq
+    _PY_CACHE[key] = (now, uniq)
+    return list(uniq)
@@ -5,61 +5,293 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
+from bisect import bisect_left
 from typing import Optional, Tuple
 
-from PySide6.QtGui import QPixmap, QImage, QColor
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QPixmap, QImage, QColor, QImageReader, QImageWriter
 
 
-def make_placeholder_thumbnail() -> QPixmap:
-    """生成占位缩略图（无QPainter，避免绘制警告）。"""
-    pix = QPixmap(48, 48)
+def make_placeholder_thumbnail(size: int = 48) -> QPixmap:
+    """生成 size×size 的占位缩略图（无QPainter，避免绘制警告）。"""
+    pix = QPixmap(max(1, size), max(1, size))
     pix.fill(QColor(230, 230, 230))
     return pix
 
 
-def load_thumbnail(path: str, max_side: int = 256) -> Optional[QImage]:
-    """尝试加载真实缩略图为QImage；失败则返回None。
+_HEIF_READY: Optional[bool] = None
+_PIL_IMAGE = None
+_PILLOW_HEIF = None
 
-    参数:
-        max_side: 最大边尺寸，默认256。会使用高质量下采样（LANCZOS）。
 
-    说明：QImage可安全跨线程传递，QPixmap需在GUI线程创建。
-    """
-    try:
-        from PIL import Image  # type: ignore
+def _pil_image():
+    """返回已注册 pillow-heif 插件的 PIL.Image 模块（进程内只导入、注册一次）；依赖缺失时返回None。"""
+    global _HEIF_READY, _PIL_IMAGE, _PILLOW_HEIF
+    if _HEIF_READY is None:
         try:
+            from PIL import Image  # type: ignore
             import pillow_heif  # type: ignore
             pillow_heif.register_heif_opener()
+            # 并发主要来自解码线程池（缩略图 CPU/2 个、转换按设置），单次 HEVC 解码再开
+            # 默认4个线程会超额占用核心；限为2，仍保留单张大图的分块并行
+            try:
+                pillow_heif.options.DECODE_THREADS = min(pillow_heif.options.DECODE_THREADS, 2)
+            except Exception:
+                pass
+            _PIL_IMAGE, _PILLOW_HEIF = Image, pillow_heif
+            _HEIF_READY = True
         except Exception:
-            return None
+            _HEIF_READY = False
+    return _PIL_IMAGE
+
+
+def _heif_preview(path: str, min_side: int):
+    """读取HEIF预览图：优先内嵌缩略图（不小于 min_side 的最小一张），否则解码主图。
+
+    返回 (PIL图像|None, (w, h)|None)；内嵌图与主图共用同一次容器解析，
+    无合适内嵌图时不再经 Pillow 插件重新打开文件；仅在文件无法按HEIF读取时返回 (None, None)。
+    调用前需已由 _pil_image() 完成导入与注册。
+    """
+    try:
+        heif = _PILLOW_HEIF.open_heif(path, convert_hdr_to_8bit=True)
+        # 内嵌缩略图挂在各帧（HeifImage）上，HeifFile 本身没有 get_thumbnail
+        img = heif[heif.primary_index]
+        size = tuple(img.size)
+        thumbs = img.info.get('thumbnails', [])
+        boxes = [b for b in thumbs if b and b >= min_side]
+        if boxes:
+            return img.get_thumbnail(thumbs.index(min(boxes))).to_pillow(), size
+        return img.to_pillow(), size
+    except (OSError, ValueError, RuntimeError):
+        # 仅文件不可读/非HEIF/解码失败视为无预览（交由 Pillow 按实际格式再试）；
+        # 接口用错等编程错误不在此吞掉
+        return None, None
+
+
+_QT_READER_EXTS = ('.jpg', '.jpeg', '.png', '.webp', '.bmp')
+
+
+def _read_scaled_qimage(path: str, max_side: int) -> Tuple[Optional[QImage], Optional[Tuple[int, int]]]:
+    """用QImageReader按目标尺寸解码（不生成全尺寸中间图），返回 (图像|None, 原图尺寸|None)。"""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    dims = (size.width(), size.height()) if size.isValid() else None
+    if size.isValid() and max(size.width(), size.height()) > max_side:
+        scale = max_side / float(max(size.width(), size.height()))
+        reader.setScaledSize(QSize(max(1, round(size.width() * scale)), max(1, round(size.height() * scale))))
+    img = reader.read()
+    return (None if img.isNull() else img), dims
+
+
+# 解码档位：请求尺寸向上取档，磁盘缓存与解码参数只出现这几种取值
+_THUMB_SIDES = (64, 128, 256, 512, 1024)
+
+
+def snap_thumb_side(max_side: int) -> int:
+    """将请求边长向上取到解码档位；界面侧据此计算请求尺寸，保证与磁盘缓存键一致。"""
+    return _THUMB_SIDES[min(bisect_left(_THUMB_SIDES, max_side), len(_THUMB_SIDES) - 1)]
+
+
+def load_thumbnail(path: str, max_side: int = 256) -> Optional[QImage]:
+    """尝试加载真实缩略图为QImage；失败则返回None。详见 load_thumbnail_and_size。"""
+    return load_thumbnail_and_size(path, max_side)[0]
+
+
+def load_thumbnail_and_size(path: str, max_side: int = 256) -> Tuple[Optional[QImage], Optional[Tuple[int, int]]]:
+    """加载真实缩略图并顺带返回原图像素尺寸：(QImage|None, (w, h)|None)。
+
+    尺寸取自解码缩略图时已读到的文件头，免去调用方再用 get_image_size 打开一次文件。
+
+    参数:
+        max_side: 最大边尺寸，默认256，向上取到 64/128/256/512/1024 档位。会使用高质量下采样（LANCZOS）。
+
+    说明：按目标尺寸解码——JPEG/PNG/WebP/BMP 由 QImageReader 直接解码到目标尺寸，
+    HEIF优先用内嵌缩略图（不小于 max_side/2 即可，此时返回图可小于 max_side），其余格式经Pillow先整数倍缩小再LANCZOS。
+    QImage可安全跨线程传递，QPixmap需在GUI线程创建。
+    """
+    max_side = snap_thumb_side(max_side)
+    dims: Optional[Tuple[int, int]] = None
+    ext = os.path.splitext(path)[1].lower()
+    if ext in _QT_READER_EXTS:
+        img, dims = _read_scaled_qimage(path, max_side)
+        if img is not None:
+            return img, dims
+    # 需经Pillow解码的格式（HEIC等）代价高，先查磁盘缓存
+    cache_file = _disk_cache_file(path, max_side)
+    if cache_file:
+        img, cached_dims = _read_disk_cache(cache_file)
+        if img is not None:
+            return img, cached_dims
+    img, dims = _decode_with_pil(path, ext, max_side)
+    if cache_file and img is not None and dims:
+        _write_disk_cache(cache_file, img, dims)
+    return img, dims
+
+
+def _decode_with_pil(path: str, ext: str, max_side: int) -> Tuple[Optional[QImage], Optional[Tuple[int, int]]]:
+    Image = _pil_image()
+    if Image is None:
+        return None, None
+    dims: Optional[Tuple[int, int]] = None
+    try:
+        if ext in ('.heic', '.heif'):
+            # 调用方按显示尺寸的2倍请求；内嵌缩略图只要不小于显示尺寸（max_side/2）即可使用，
+            # 例如 Apple 的 320px 内嵌图可满足 512 档（原样返回320px，不放大），避免整张 HEVC 解码
+            preview, dims = _heif_preview(path, max_side // 2)
+            if preview is not None:
+                with preview as im:
+                    return _pil_to_qimage(_shrink(im, max_side)), dims
         with Image.open(path) as im:
-            # 限制到 max_side，并使用高质量采样
-            max_side = max(64, min(1024, int(max_side)))
-            im.thumbnail((max_side, max_side), Image.LANCZOS)
-            img = im.convert('RGB')
-            # 注意：QImage使用外部缓冲区时需拷贝，避免悬空指针
-            data = img.tobytes('raw', 'RGB')
-            w, h = img.width, img.height
-            bytes_per_line = w * 3
-            qimg = QImage(data, w, h, bytes_per_line, QImage.Format.Format_RGB888).copy()
-            return qimg
+            dims = tuple(im.size)
+            if im.format == 'JPEG':
+                im.draft('RGB', (max_side, max_side))  # DCT域按 1/2、1/4、1/8 直接缩小
+            return _pil_to_qimage(_shrink(im, max_side)), dims
     except Exception:
+        return None, dims
+
+
+# 缩略图磁盘缓存：~/.heic2any/thumbs/<hash>.jpg，键含 (路径, 修改时间, 文件大小, 解码档位)，
+# 源文件变化后键随之改变；原图尺寸写在JPEG注释中。超过容量时按修改时间淘汰最旧的文件。
+_DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.heic2any', 'thumbs')
+_DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_DISK_CACHE_PRUNE_EVERY = 128
+_disk_cache_lock = threading.Lock()
+_disk_cache_writes = 0
+
+
+def _disk_cache_file(path: str, max_side: int) -> Optional[str]:
+    try:
+        st = os.stat(path)
+    except OSError:
         return None
+    key = f"{os.path.abspath(path)}\0{st.st_mtime_ns}\0{st.st_size}\0{max_side}"
+    digest = hashlib.blake2b(key.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+    return os.path.join(_DISK_CACHE_DIR, digest + '.jpg')
+
+
+def _read_disk_cache(cache_file: str) -> Tuple[Optional[QImage], Optional[Tuple[int, int]]]:
+    if not os.path.isfile(cache_file):
+        return None, None
+    img = QImageReader(cache_file).read()
+    if img.isNull():
+        return None, None
+    w, _, h = img.text('dims').partition('x')
+    if not (w.isdigit() and h.isdigit()):
+        return None, None
+    try:
+        os.utime(cache_file)  # 命中即刷新修改时间，淘汰时保留常用项
+    except OSError:
+        pass
+    return img, (int(w), int(h))
+
+
+def _write_disk_cache(cache_file: str, img: QImage, dims: Tuple[int, int]) -> None:
+    global _disk_cache_writes
+    if img.hasAlphaChannel():
+        return  # JPEG 不保存透明通道
+    tmp = f"{cache_file}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        writer = QImageWriter(tmp, b'jpg')
+        writer.setQuality(90)
+        writer.setText('dims', f"{dims[0]}x{dims[1]}")
+        if writer.write(img):
+            os.replace(tmp, cache_file)
+        else:
+            os.remove(tmp)
+    except OSError:
+        return
+    with _disk_cache_lock:
+        _disk_cache_writes += 1
+        due = _disk_cache_writes % _DISK_CACHE_PRUNE_EVERY == 0
+    if due:
+        _prune_disk_cache()
+
+
+def _prune_disk_cache() -> None:
+    """总量超过上限时删除最久未用的缓存文件，降到上限的80%。"""
+    if not _disk_cache_lock.acquire(blocking=False):
+        return
+    try:
+        entries = []
+        total = 0
+        with os.scandir(_DISK_CACHE_DIR) as it:
+            for e in it:
+                if e.name.endswith('.jpg'):
+                    st = e.stat()
+                    entries.append((st.st_mtime_ns, st.st_size, e.path))
+                    total += st.st_size
+        if total <= _DISK_CACHE_MAX_BYTES:
+            return
+        entries.sort()
+        limit = _DISK_CACHE_MAX_BYTES * 4 // 5
+        for _, size, p in entries:
+            try:
+                os.remove(p)
+                total -= size
+            except OSError:
+                pass
+            if total <= limit:
+                break
+    except OSError:
+        pass
+    finally:
+        _disk_cache_lock.release()
+
+
+def _shrink(im, max_side: int):
+    """就地等比缩小到 max_side 以内并返回 im。
+
+    reducing_gap=2.0：先用整数倍 reduce() 缩到目标的2倍以内，LANCZOS 只处理剩余比例；
+    Pillow 的 C 实现按行/列可分离卷积，每轴权重表每次调用只计算一次。
+    """
+    im.thumbnail((max_side, max_side), _PIL_IMAGE.LANCZOS, reducing_gap=2.0)
+    return im
+
+
+_QIMAGE_FORMATS = {
+    'RGB': (QImage.Format.Format_RGB888, 3),
+    'RGBA': (QImage.Format.Format_RGBA8888, 4),
+    'L': (QImage.Format.Format_Grayscale8, 1),
+}
+
+
+def _pil_to_qimage(im) -> QImage:
+    # RGB/RGBA/灰度可直接按原通道取字节，其余模式才 convert('RGB')（convert 总会复制一份整图）
+    spec = _QIMAGE_FORMATS.get(im.mode)
+    if spec is None:
+        im = im.convert('RGB')
+        spec = _QIMAGE_FORMATS['RGB']
+    fmt, channels = spec
+    # PySide6 以外部缓冲区构造 QImage 时会持有 data 的引用（随最后一个共享副本释放），
+    # 无悬空指针风险，故不再 copy()：每张缩略图少一次整图分配与拷贝
+    data = im.tobytes('raw', im.mode)
+    w, h = im.width, im.height
+    return QImage(data, w, h, w * channels, fmt)
 
 
 def get_image_size(path: str) -> Optional[Tuple[int, int]]:
     """快速读取图片像素尺寸，失败返回None。
 
-    使用Pillow打开文件仅读取元数据，避免完整解码，性能友好。
-    需要 pillow-heif 支持 HEIC/HEIF；缺失时返回None。
+    JPEG/PNG/WebP/BMP 由 QImageReader 仅解析文件头，不初始化 libheif；
+    HEIC/HEIF 直接用 pillow_heif.open_heif 读取容器头（不解码像素，也不经过 Pillow 插件层）；
+    其余格式使用Pillow打开文件仅读取元数据。需要 pillow-heif，缺失时返回None。
+    尺寸与转换输出一致，不按 EXIF 方向交换宽高（转换时不做方向校正）。
     """
+    if path.lower().endswith(_QT_READER_EXTS):
+        size = QImageReader(path).size()
+        if size.isValid():
+            return (size.width(), size.height())
+    Image = _pil_image()
+    if Image is None:
+        return None
     try:
-        from PIL import Image  # type: ignore
-        try:
-            import pillow_heif  # type: ignore
-            pillow_heif.register_heif_opener()
-        except Exception:
-            return None
+        if path.lower().endswith(('.heic', '.heif')):
+            return tuple(_PILLOW_HEIF.open_heif(path).size)
         with Image.open(path) as im:
             return tuple(im.size)  # (w, h)
     except Exception:
@@ -6,38 +6,84 @@
 from __future__ import annotations
 
 import os
+import re
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Tuple
 
 from heic2any.core.state import JobItem
 
 
+# 日期Token缓存：(整秒时间戳, {date}, {datetime})，同一秒内的批量命名复用格式化结果
+_DATE_CACHE: Tuple[int, str, str] = (-1, "", "")
+
+
+def _date_tokens() -> Tuple[str, str]:
+    global _DATE_CACHE
+    sec = int(time.time())
+    if _DATE_CACHE[0] != sec:
+        now = datetime.fromtimestamp(sec)
+        _DATE_CACHE = (sec, now.strftime("%Y%m%d"), now.strftime("%Y%m%d_%H%M%S"))
+    return _DATE_CACHE[1], _DATE_CACHE[2]
+
+
+_TOKEN_RE = re.compile(r"\{(name|index|date|datetime|width|height|w|h|fmt|q)\}")
+
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Tuple[str, ...]:
+    """将模板预先切分为 (字面量, Token, 字面量, Token, ..., 字面量)；同一批任务共用同一模板，只解析一次。"""
+    return tuple(_TOKEN_RE.split(template))
+
+
+def _token_value(key: str, job: JobItem, index: int) -> str:
+    if key == "name":
+        return job.stem
+    if key == "index":
+        return str(index)
+    if key in ("date", "datetime"):
+        return _date_tokens()[key == "datetime"]
+    if key == "fmt":
+        return str(job.export_format)
+    if key == "q":
+        return str(job.quality)
+    w, h = job.req_size if any(job.req_size) else job.orig_size
+    return str((w if key in ("width", "w") else h) or 0)
+
+
 def render_output_name(template: str, job: JobItem, index: int) -> str:
     """根据模板渲染输出文件名（不含扩展名）。
 
     支持Token：{name}（原文件名不含扩展）；{index}；{date}；{datetime}；{width}/{height}；别名 {w}/{h}；{fmt}（格式）；{q}（质量/等级）
+    模板按字面量/Token 预切分并缓存，渲染只需按段拼接：替换结果不会被再次展开
+    （如文件名本身含“{index}”）；日期只在模板引用时才格式化。
     """
-    stem = os.path.splitext(os.path.basename(job.src_path))[0]
-    now = datetime.now()
-    w, h = job.req_size if any(job.req_size) else job.orig_size
-    w = w or 0
-    h = h or 0
-    name = template
-    name = name.replace("{name}", stem)
-    name = name.replace("{index}", str(index))
-    name = name.replace("{date}", now.strftime("%Y%m%d"))
-    name = name.replace("{datetime}", now.strftime("%Y%m%d_%H%M%S"))
-    name = name.replace("{width}", str(w))
-    name = name.replace("{height}", str(h))
-    name = name.replace("{w}", str(w))
-    name = name.replace("{h}", str(h))
-    name = name.replace("{fmt}", str(job.export_format))
-    name = name.replace("{q}", str(job.quality))
-    return name
+    parts = _compile_template(template)
+    if len(parts) == 1:
+        return template
+    out = list(parts)
+    for i in range(1, len(out), 2):
+        out[i] = _token_value(out[i], job, index)
+    return "".join(out)
+
+
+@lru_cache(maxsize=64)
+def _dir_prefix(export_dir: str) -> str:
+    """输出目录连同结尾分隔符（等价于 os.path.join 的拼接结果），按目录缓存。"""
+    return os.path.join(export_dir, "")
+
+
+@lru_cache(maxsize=16)
+def _ext_for(fmt: str) -> str:
+    return fmt.lower().replace('jpeg', 'jpg')
 
 
 def build_output_path(job: JobItem, index: int) -> str:
-    """构建完整输出路径（含扩展名）。"""
+    """构建完整输出路径（含扩展名）。
+
+    目录前缀与扩展名按取值缓存（任务的输出目录可随设置改变，故不存到任务上），
+    每次只需一次字符串拼接。
+    """
     fname = render_output_name(job.template, job, index)
-    ext = job.export_format.lower().replace('jpeg', 'jpg')
-    return os.path.join(job.export_dir, f"{fname}.{ext}")
+    return f"{_dir_prefix(job.export_dir)}{fname}.{_ext_for(job.export_format)}"
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""缩略图解码：HEIF 内嵌缩略图与主图解码路径。"""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip('pillow_heif')
+
+from heic2any.utils import images  # noqa: E402
+
+
+def _make_heic(path, size=(800, 600), thumbnails=(320,)):
+    from PIL import Image
+    import pillow_heif
+    im = Image.effect_noise(size, 60).convert('RGB')
+    pillow_heif.from_pillow(im).save(str(path), quality=60, thumbnails=list(thumbnails))
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(images, '_DISK_CACHE_DIR', str(tmp_path / 'thumbs'))
+
+
+def test_heif_preview_uses_embedded_thumbnail(tmp_path):
+    src = _make_heic(tmp_path / 'a.heic')
+    assert images._pil_image() is not None
+    preview, dims = images._heif_preview(src, 128)
+    assert dims == (800, 600)
+    assert preview is not None and preview.size == (320, 240)
+
+
+def test_load_thumbnail_from_embedded_thumbnail(tmp_path):
+    src = _make_heic(tmp_path / 'a.heic')
+    img, dims = images.load_thumbnail_and_size(src, 256)
+    assert dims == (800, 600)
+    assert img is not None and (img.width(), img.height()) == (256, 192)
+
+
+def test_embedded_thumbnail_covers_512_tier(tmp_path):
+    # 512 档只需不小于 256 的内嵌图：直接用 320px 预览，不整图解码
+    src = _make_heic(tmp_path / 'a.heic')
+    img, dims = images.load_thumbnail_and_size(src, 512)
+    assert dims == (800, 600)
+    assert img is not None and (img.width(), img.height()) == (320, 240)
+
+
+def test_large_tier_decodes_primary_image(tmp_path):
+    src = _make_heic(tmp_path / 'a.heic')
+    img, dims = images.load_thumbnail_and_size(src, 1024)
+    assert dims == (800, 600)
+    assert img is not None and (img.width(), img.height()) == (800, 600)
+
+
+def test_primary_decoded_without_second_open(tmp_path, monkeypatch):
+    # 无内嵌缩略图时直接解码已打开容器的主图，不再经 Image.open 重新解析文件
+    src = _make_heic(tmp_path / 'a.heic', thumbnails=())
+    Image = images._pil_image()
+
+    def _no_reopen(*args, **kwargs):
+        raise AssertionError('Image.open should not be called for a readable HEIC')
+
+    monkeypatch.setattr(Image, 'open', _no_reopen)
+    img, dims = images.load_thumbnail_and_size(src, 256)
+    assert dims == (800, 600)
+    assert img is not None and (img.width(), img.height()) == (256, 192)
+
+
+def test_heif_preview_does_not_swallow_api_errors(tmp_path, monkeypatch):
+    import pillow_heif
+    src = _make_heic(tmp_path / 'a.heic')
+    images._pil_image()
+
+    def _broken(self, index):
+        raise AttributeError('get_thumbnail')
+
+    monkeypatch.setattr(pillow_heif.HeifImage, 'get_thumbnail', _broken)
+    with pytest.raises(AttributeError):
+        images._heif_preview(src, 128)
+
+
+def test_heif_preview_returns_none_for_non_heif(tmp_path):
+    src = tmp_path / 'fake.heic'
+    src.write_bytes(b'not a heif file')
+    images._pil_image()
+    assert images._heif_preview(str(src), 128) == (None, None)